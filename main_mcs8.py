@@ -4,6 +4,9 @@ Main MCS8 User Interface module.
 Provides the primary GUI interface for MCS8 device control.
 """
 
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 from mcs8_func import MCS8, CreateToolTip
@@ -29,6 +32,21 @@ class MCSUI:
         self.command_history = []
         self.history_index = -1
         
+        # Background status polling; the Tk thread picks the results up from the
+        # queue with its own after() loop, the poller never touches Tk
+        self._status_queue = queue.Queue(maxsize=1)
+        self._status_stop = threading.Event()
+        self._status_thread = None
+        self._status_drain_interval = 200  # ms between checks of the status queue
+        self._status_drain_id = None  # after() id of the next check
+        self._shown_status_texts = {}  # label -> text currently shown
+        self._display_tab_active = False
+        self._pending_settings_reload = None  # after() id of a debounced settings reload
+        
+        # Long-running DLL calls (saving) run here so the Tk loop stays responsive;
+        # MCS8 serializes them with the other threads' DLL calls
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcs8-io")
+        
         # Performance optimization flags
         self.display_update_pending = False
         self.display_update_interval = 500  # ms 
@@ -46,6 +64,20 @@ class MCSUI:
         # Set initial window size
         self.root.geometry("1000x800")
         self.root.update_idletasks()
+        
+        # Stop the background poller before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Stop background work and close the window"""
+        self._status_stop.set()
+        if self.display is not None and hasattr(self.display, 'stop_efficient_updates'):
+            self.display.stop_efficient_updates()
+        if self._status_drain_id is not None:
+            self.root.after_cancel(self._status_drain_id)
+            self._status_drain_id = None
+        self._io_pool.shutdown(wait=False)
+        self.root.destroy()
 
     def refresh_settings(self):
         self.acq = self.mcs.get_acq_setting(0)
@@ -105,7 +137,7 @@ class MCSUI:
         )
         settings_menu.add_command(
             label="Save Configuration",
-            command=self.mcs.save_cnf
+            command=lambda: self._run_in_background(self.mcs.save_cnf, "Save Config")
         )
         settings_menu.add_command(
             label="Load Configuration",
@@ -178,8 +210,8 @@ class MCSUI:
             ("Set Filename", self._set_filename_from_entry),
             ("Browse", self._browse_file),
             ("Load MPA", self._load_mpa),
-            ("Save Config", self.mcs.save_cnf),
-            ("Save MPA", self.mcs.savempa)
+            ("Save Config", lambda: self._run_in_background(self.mcs.save_cnf, "Save Config")),
+            ("Save MPA", lambda: self._run_in_background(self.mcs.savempa, "Save MPA"))
         ]
         
         for text, command in file_buttons:
@@ -253,11 +285,10 @@ class MCSUI:
         """Start data acquisition with display refresh"""
         self.refresh_settings()
 
-        if self.display:
-            self.display._clear_display()
         self.mcs.start()
         if self.display:
-            self.root.after(500, lambda: self.display.create_display())
+            # update_plot only rebuilds the figure if the channel layout changed
+            self.root.after(500, lambda: self.display.update_plot(force=True))
             self.display.start_live_updates()
 
     def _stop(self):
@@ -269,19 +300,15 @@ class MCSUI:
     def _continue(self):
         """Continue data acquisition with display refresh"""
         self._isplaying = True
-        if self.display:
-            self.display._clear_display()
         self.mcs.continue_device()
         if self.display:
-            self.root.after(1000, lambda: self.display.create_display())
+            self.root.after(1000, lambda: self.display.update_plot(force=True))
 
     def _erase(self):
         """Erase data with display refresh"""
-        if self.display:
-            self.display._clear_display()
         self.mcs.erase()
         if self.display:
-            self.root.after(1000, lambda: self.display.create_display())
+            self.root.after(1000, lambda: self.display.update_plot(force=True))
 
     # File handling methods
     def _update_filename(self, event):
@@ -466,7 +493,7 @@ class MCSUI:
             if any(setting in command.lower() for setting in 
                    ['filename', 'board', 'dat', 'acq', 'range', 'dac', 'sweep']):
                 #self._update_settings_display()
-                self.settings_manager.load_channel_settings()
+                self._schedule_settings_reload()
                 
         except Exception as e:
             self._append_to_output(f"Error: {str(e)}\n")
@@ -499,6 +526,21 @@ class MCSUI:
                 self.command_entry.delete(0, tk.END)
         return 'break'
 
+    def _run_in_background(self, func, description):
+        """Run a blocking DLL call on the I/O worker and report the outcome on the Tk thread"""
+        future = self._io_pool.submit(func)
+        self.root.after(100, self._report_when_done, future, description)
+        return future
+
+    def _report_when_done(self, future, description):
+        """Poll a background call from the Tk thread and report its outcome once it finished"""
+        if not future.done():
+            self.root.after(100, self._report_when_done, future, description)
+            return
+        
+        error = future.exception()
+        self._append_to_output(f"{description} failed: {error}\n" if error else f"{description} done.\n")
+
     def _append_to_output(self, text):
         """Append text to command output area"""
         self.command_output.config(state='normal')
@@ -523,15 +565,16 @@ class MCSUI:
     def _update_settings_display(self):
         """Update all settings displays with current values"""
         try:
-            # Update traditional settings
+            # Update traditional settings from a single snapshot
+            _, acq, dat, board = self.mcs.snapshot()
             self.settings_manager.update_settings_display(
-                self.acq_settings, lambda: self.mcs.get_acq_setting()
+                self.acq_settings, lambda: acq
             )
             self.settings_manager.update_settings_display(
-                self.dat_settings, lambda: self.mcs.get_dat_setting()
+                self.dat_settings, lambda: dat
             )
             self.settings_manager.update_settings_display(
-                self.board_settings, lambda: self.mcs.get_mcs_setting()
+                self.board_settings, lambda: board
             )
                 
         except Exception as e:
@@ -539,38 +582,78 @@ class MCSUI:
             self._append_to_output(f"Settings Update Error: {str(e)}\n")
 
     def _start_refresh_timer(self):
-        """Start the refresh timer"""
+        """Do one refresh now and start the background status poller"""
         self._refresh_view()
-        self.root.after(REFRESH_RATE, self._start_refresh_timer)
+        self._status_thread = threading.Thread(target=self._status_poll_loop, daemon=True)
+        self._status_thread.start()
+        self._status_drain_id = self.root.after(self._status_drain_interval, self._drain_status_queue)
+
+    def _poll_status_texts(self):
+        """Read status and settings from the DLL and format them (safe to call off the Tk thread)"""
+        status, acq, dat, board = self.mcs.snapshot()
+        return (MCS8.status_text(status),
+                MCS8.acq_setting_text(acq),
+                MCS8.dat_setting_text(dat),
+                MCS8.board_setting_text(board))
+
+    def _apply_status_texts(self, texts):
+        """Write status texts to their labels, skipping labels whose text is unchanged"""
+        labels = (self.status_label,
+                  self.status_labels["Acquisition Settings"],
+                  self.status_labels["Data Settings"],
+                  self.status_labels["Board Settings"])
+        for label, text in zip(labels, texts):
+            if self._shown_status_texts.get(label) != text:
+                label.config(text=text)
+                self._shown_status_texts[label] = text
+
+    def _status_poll_loop(self):
+        """Background loop: poll the DLL and queue changed results for the Tk thread"""
+        last_texts = None
+        while not self._status_stop.wait(REFRESH_RATE / 1000):
+            self.rev_count += 1
+            dll_down = False
+            if self.rev_count > 3:
+                self.rev_count = 0
+                dll_down = not self.dl_warning_shown and self.mcs.check_status() == 0
+            
+            texts = None
+            if not self._display_tab_active:
+                try:
+                    texts = self._poll_status_texts()
+                except Exception as e:
+                    print(f"Error in refresh: {e}")
+            
+            if (texts is None or texts == last_texts) and not dll_down:
+                continue
+            if texts is not None:
+                last_texts = texts
+            
+            # Keep only the newest result in the queue
+            try:
+                self._status_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._status_queue.put_nowait((texts, dll_down))
+
+    def _drain_status_queue(self):
+        """Apply the latest result from the status poller, then check again later (Tk thread)"""
+        self._status_drain_id = self.root.after(self._status_drain_interval, self._drain_status_queue)
+        try:
+            texts, dll_down = self._status_queue.get_nowait()
+        except queue.Empty:
+            return
         
-    def _refresh_view(self):
-        """Update all status displays and labels"""
-        self.rev_count += 1
-        if self.rev_count > 3:
-            self.rev_count = 0
+        if dll_down:
             self.check_DLL()
+        if texts is not None:
+            self._apply_status_texts(texts)
         
+    def _refresh_view(self):
+        """Update all status displays and labels"""
         try:
-            current_tab = self.notebook.select()
-            display_tab = self.notebook.tabs()[-1]
-            
-            if current_tab != display_tab:
-                status = self.mcs.get_status()
-                acq = self.mcs.get_acq_setting()
-                dat = self.mcs.get_dat_setting()
-                board = self.mcs.get_mcs_setting()
-
-                # Update status displays
-                self.status_label.config(text=MCS8.status_text(status))
-                self.status_labels["Acquisition Settings"].config(
-                    text=MCS8.acq_setting_text(acq)
-                )
-                self.status_labels["Data Settings"].config(
-                    text=MCS8.dat_setting_text(dat)
-                )
-                self.status_labels["Board Settings"].config(
-                    text=MCS8.board_setting_text(board)
-                )
+            if not self._display_tab_active:
+                self._apply_status_texts(self._poll_status_texts())
 
         except Exception as e:
             print(f"Error in refresh: {e}")
@@ -593,6 +676,7 @@ class MCSUI:
             self.settings_manager.load_channel_settings()
         
         self._last_tab = current_tab
+        self._display_tab_active = current_tab == display_tab
 
     # Menu and shortcut methods
     def _focus_channel_settings(self):
@@ -600,10 +684,21 @@ class MCSUI:
         self.notebook.select(self.tab_channels)
         # Focus on first available entry widget
         for widget_info in self.settings_manager.channel_widgets.values():
-            if 'entry' in widget_info:
-                widget_info['entry'].focus_set()
+            if widget_info.entry is not None:
+                widget_info.entry.focus_set()
                 break
 
+    def _schedule_settings_reload(self, delay_ms: int = 10):
+        """Reload channel settings once, delay_ms after the last of several quick changes"""
+        if self._pending_settings_reload is not None:
+            self.root.after_cancel(self._pending_settings_reload)
+        self._pending_settings_reload = self.root.after(delay_ms, self._run_settings_reload)
+
+    def _run_settings_reload(self):
+        """Run the debounced settings reload"""
+        self._pending_settings_reload = None
+        self.settings_manager.load_channel_settings()
+
     def _manual_refresh_all(self):
         """Manually refresh all settings"""
         self._refresh_view()
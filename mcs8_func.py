@@ -1,9 +1,49 @@
 import tkinter as tk
 from tkinter import ttk
 import ctypes
+import threading
+import functools
+import queue
+import time
 from ctypes import c_int, POINTER, byref
+import numpy as np
 from structures import *
 
+# Pre-encoded command prefixes for the built-in command interpreter
+_RANGE_PREFIX   = b"range="
+_MPANAME_PREFIX = b"mpaname="
+_SAVECNF_CMD    = b"savecnf"
+_SAVEMPA_CMD    = b"savempa"
+
+# Size of the reusable RunCmd buffer; RunCmd writes its result back into it
+_CMD_BUF_SIZE   = 4096
+_CMD_RESULT_ROOM = 1024
+
+
+def _field_values(struct, fields) -> tuple:
+    """Return the values of the (attribute, label) fields of a struct as a hashable tuple"""
+    return tuple(getattr(struct, name) for name, _ in fields)
+
+
+@functools.lru_cache(maxsize=16)
+def _format_fields(fields, values, *extra) -> str:
+    """Format (attribute, label) fields and their values as 'Label: value' lines"""
+    lines = [f"{label}: {value}" for (_, label), value in zip(fields, values)]
+    lines.extend(f"{label}: {value}" for label, value in extra)
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=16)
+def _format_status(values) -> str:
+    """Format (started, maxval, runtime, sweeps, starts) as the status text"""
+    started, maxval, runtime, sweeps, starts = values
+    return (f"Acquisition Started: {started}\n"
+            f"Max Value: {maxval}\n"
+            f"Runtime: {runtime}\n"
+            f"Sweeps: {sweeps}\n"
+            f"Starts: {starts}")
+
+
 # Add this tooltip class at the top of the file
 class CreateToolTip(object):
     def __init__(self, widget, text='widget info'):
@@ -74,11 +114,33 @@ class MCS8:
     ST_STARTS    = 6
     ST_ZEROEVTS  = 7
 
+    CLI_POLL_INTERVAL = 0.5  # Seconds between idle status polls in run_command_loop
+
+    # The GUI calls the DLL from the Tk thread, the status poller, the live plot
+    # updater and the save worker. Until the DLL is known to be thread-safe every
+    # entry point is serialized through one lock (see _setup_dll).
+    DLL_THREAD_SAFE = False
+
     def __init__(self, device: int = 0, dll_path: str = "dmcs8.dll"):
         self.nDev = device
         self.dll = ctypes.WinDLL(dll_path)
+        # Re-entrant so multi-call sequences (snapshot) can hold it across their calls
+        self._dll_lock = threading.RLock()
         self._setup_dll()
 
+        # Reusable GetBlock buffer, reallocated only when the block length changes
+        self._block_buf = None
+        self._block_buf_len = 0
+
+        # Scratch struct for check_status, whose contents are never read
+        self._acq_scratch = ACQSETTING()
+
+        # Per-thread ACQSTATUS and RunCmd buffers reused by get_status and run_cmd
+        self._thread_local = threading.local()
+
+        # Bumped by every run_cmd (under _dll_lock) so callers can cache settings read from the device
+        self.settings_generation = 0
+
     def _setup_dll(self) -> None:
         """Configure DLL function signatures."""
         self.dll.RunCmd.argtypes = [c_int, ctypes.c_char_p]
@@ -96,10 +158,11 @@ class MCS8:
         self.dll.LVGetCnt.argtypes = [POINTER(c_double), c_int]
         self.dll.LVGetCnt.restype  = c_int
 
-        self.dll.LVGetRoi.argtypes = [POINTER(c_int), c_int]
+        # Raw buffers are passed as c_void_p so calls skip POINTER type checks
+        self.dll.LVGetRoi.argtypes = [ctypes.c_void_p, c_int]
         self.dll.LVGetRoi.restype  = c_int
 
-        self.dll.LVGetDat.argtypes = [POINTER(c_int), c_int]
+        self.dll.LVGetDat.argtypes = [ctypes.c_void_p, c_int]
         self.dll.LVGetDat.restype  = c_int
 
         self.dll.LVGetCDefData.argtypes = [POINTER(LVCOINCDEF)]
@@ -111,7 +174,7 @@ class MCS8:
         self.dll.GetDatSetting.argtypes = [POINTER(DATSETTING)]
         self.dll.GetDatSetting.restype  = c_int
 
-        self.dll.GetBlock.argtypes = [POINTER(c_int), c_int, c_int, c_int, c_int]
+        self.dll.GetBlock.argtypes = [ctypes.c_void_p, c_int, c_int, c_int, c_int]
         self.dll.GetBlock.restype  = None
 
         self.dll.Start.argtypes = [c_int]
@@ -130,37 +193,74 @@ class MCS8:
         self.dll.SaveData.argtypes = [c_int, c_int]
         self.dll.SaveData.restype  = None
 
-    def run_cmd(self, command: str) -> str:
-        """Send a command string to the device and return the modified string."""
-        # Create a mutable buffer with extra space for the result
-        buffer_size = len(command) + 1024  # Command + space for sprintf result
-        command_buffer = ctypes.create_string_buffer(command.encode('utf-8'), buffer_size)
+        # Bind the configured entry points once so calls skip the WinDLL lookup
+        locked = self._locked
+        self._RunCmd         = locked(self.dll.RunCmd)
+        self._GetStatus      = locked(self.dll.GetStatus)
+        self._GetStatusData  = locked(self.dll.GetStatusData)
+        self._GetSettingData = locked(self.dll.GetSettingData)
+        self._GetMCSSetting  = locked(self.dll.GetMCSSetting)
+        self._GetDatSetting  = locked(self.dll.GetDatSetting)
+        self._LVGetCDefData  = locked(self.dll.LVGetCDefData)
+        self._GetBlock       = locked(self.dll.GetBlock)
+        self._Start          = locked(self.dll.Start)
+        self._Halt           = locked(self.dll.Halt)
+        self._Continue       = locked(self.dll.Continue)
+        self._Erase          = locked(self.dll.Erase)
+        self._SaveData       = locked(self.dll.SaveData)
+
+    def _locked(self, func):
+        """Wrap a DLL entry point so calls from different threads never overlap"""
+        if self.DLL_THREAD_SAFE:
+            return func
+        lock = self._dll_lock
+
+        def call(*args):
+            with lock:
+                return func(*args)
+        return call
+
+    def run_cmd(self, command) -> str:
+        """Send a command (str or already encoded bytes) to the device and return the modified string."""
+        if isinstance(command, str):
+            command = command.encode('utf-8')
         
-        # Configure the DLL function signature
-        self.dll.RunCmd.argtypes = [ctypes.c_int, ctypes.c_char_p]
-        self.dll.RunCmd.restype = None
+        # Reuse a per-thread buffer when the command plus room for the sprintf
+        # result fits, otherwise allocate one just for this call
+        buffer_size = len(command) + _CMD_RESULT_ROOM
+        if buffer_size <= _CMD_BUF_SIZE:
+            command_buffer = getattr(self._thread_local, 'cmd_buf', None)
+            if command_buffer is None:
+                command_buffer = self._thread_local.cmd_buf = ctypes.create_string_buffer(_CMD_BUF_SIZE)
+            command_buffer.value = command
+        else:
+            command_buffer = ctypes.create_string_buffer(command, buffer_size)
         
-        # Call the function - it will modify command_buffer in-place
-        self.dll.RunCmd(0, command_buffer)
+        # Call the function - it will modify command_buffer in-place. The counter is
+        # bumped under the same lock, since the save worker and the GUI threads
+        # all send commands
+        with self._dll_lock:
+            self._RunCmd(0, command_buffer)
+            self.settings_generation += 1
         
         # Return the modified string
         return command_buffer.value.decode('utf-8')
 
     def start(self) -> None:
         """Start measurement."""
-        self.dll.Start(self.nDev)
+        self._Start(self.nDev)
     
     def halt(self) -> None:
         """Stop measurement."""
-        self.dll.Halt(self.nDev)
+        self._Halt(self.nDev)
     
     def continue_device(self) -> None:
         """Continue measurement."""
-        self.dll.Continue(self.nDev)
+        self._Continue(self.nDev)
 
     def erase(self) -> None:
         """Erase spectrum."""
-        self.dll.Erase(self.nDev)
+        self._Erase(self.nDev)
 
     def save_data(self, all_val: int) -> None:
         """
@@ -169,36 +269,68 @@ class MCS8:
         Args:
             all_val (int): Use 1 to save all data.
         """
-        self.dll.SaveData(self.nDev, all_val)
+        self._SaveData(self.nDev, all_val)
 
     def set_mpaname(self, filename: str) -> None:
         """
         Set the MPA filename.
         
-        This sends the command "mpaname=filename" to the device.
+        This sends the command "mpaname=filename" to the device. The filename
+        may be given as str or as already encoded bytes.
         """
-        self.run_cmd(f"mpaname={filename}")
+        if isinstance(filename, str):
+            filename = filename.encode('utf-8')
+        self.run_cmd(_MPANAME_PREFIX + filename)
 
     def save_cnf(self) -> None:
         """Store the current settings to MCS8A.SET (save configuration)."""
-        self.run_cmd("savecnf")
+        self.run_cmd(_SAVECNF_CMD)
 
     def savempa(self) -> None:
         """Save configuration and spectra data (overwrite existing file)."""
-        self.run_cmd("savempa")
+        self.run_cmd(_SAVEMPA_CMD)
 
     def get_status(self) -> ACQSTATUS:
         """
         Retrieve the current acquisition status.
         
+        The returned structure is reused by the next get_status call from the
+        same thread; copy any fields that must be kept.
+        
         Returns:
             ACQSTATUS: Status information from the device.
         """
-        self.dll.GetStatus(self.nDev)
-        status = ACQSTATUS()
-        self.dll.GetStatusData(byref(status), self.nDev)
+        self._GetStatus(self.nDev)
+        status = getattr(self._thread_local, 'status', None)
+        if status is None:
+            status = self._thread_local.status = ACQSTATUS()
+        self._GetStatusData(byref(status), self.nDev)
         return status
 
+    def snapshot(self) -> tuple:
+        """
+        Retrieve status, acquisition (channel 0), data and board settings in one call.
+        
+        The four structures are allocated once per calling thread and refilled
+        on every call; copy any fields that must be kept.
+        
+        Returns:
+            tuple: (ACQSTATUS, ACQSETTING, DATSETTING, BOARDSETTING)
+        """
+        structs = getattr(self._thread_local, 'snapshot', None)
+        if structs is None:
+            structs = self._thread_local.snapshot = (
+                ACQSTATUS(), ACQSETTING(), DATSETTING(), BOARDSETTING())
+        status, acq, dat, board = structs
+        # Hold the lock across all five calls so the structs describe one moment
+        with self._dll_lock:
+            self._GetStatus(self.nDev)
+            self._GetStatusData(byref(status), self.nDev)
+            self._GetSettingData(byref(acq), 0)
+            self._GetDatSetting(byref(dat))
+            self._GetMCSSetting(byref(board), self.nDev)
+        return structs
+
     def get_acq_setting(self, channel_id=0) -> ACQSETTING:
         """
         Retrieve the acquisition settings from the device.
@@ -207,12 +339,11 @@ class MCS8:
             ACQSETTING: The acquisition settings structure.
         """
         acq = ACQSETTING()
-        self.dll.GetSettingData(byref(acq), channel_id)
+        self._GetSettingData(byref(acq), channel_id)
         return acq
 
     def check_status(self):
-        acq = ACQSETTING()
-        return self.dll.GetSettingData(byref(acq), self.nDev)
+        return self._GetSettingData(byref(self._acq_scratch), self.nDev)
     
     def get_dat_setting(self) -> DATSETTING:
         """
@@ -222,7 +353,7 @@ class MCS8:
             DATSETTING: The data settings structure.
         """
         dat = DATSETTING()
-        self.dll.GetDatSetting(byref(dat))
+        self._GetDatSetting(byref(dat))
         return dat
 
     def get_mcs_setting(self) -> BOARDSETTING:
@@ -233,7 +364,7 @@ class MCS8:
             BOARDSETTING: The board settings structure.
         """
         board = BOARDSETTING()
-        self.dll.GetMCSSetting(byref(board), self.nDev)
+        self._GetMCSSetting(byref(board), self.nDev)
         return board
 
     def get_lvcoincdef(self) -> LVCOINCDEF:
@@ -244,26 +375,97 @@ class MCS8:
             LVCOINCDEF: The coincidence definition structure.
         """
         lcdef = LVCOINCDEF()
-        self.dll.LVGetCDefData(byref(lcdef))
+        self._LVGetCDefData(byref(lcdef))
         return lcdef
 
-    def get_block(self, start: int, end: int, step: int = 1, channel_id: int = 0) -> list:
+    def get_block(self, start: int, end: int, step: int = 1, channel_id: int = 0,
+                  out: np.ndarray = None) -> np.ndarray:
         """
         Retrieve a block of data points.
         
+        If ``out`` is a C-contiguous int32 array of the right length the DLL
+        writes straight into it. Otherwise the DLL writes into a ctypes buffer
+        kept on the instance (reallocated only when the length changes) and the
+        result is copied out with a single ctypes.memmove.
+        
         Args:
             start (int): Starting index.
             end (int): Ending index (non-inclusive).
             step (int, optional): Step size.
             channel_id (int, optional): Channel ID.
+            out (np.ndarray, optional): Preallocated int32 array of length
+                end - start to store the block in.
         
         Returns:
-            list: A list of data points.
+            np.ndarray: The data points as int32 (``out`` if given, otherwise
+            a new array). Use .tolist() if a list is needed.
         """
         num_points = end - start
-        block = (c_int * num_points)()
-        self.dll.GetBlock(block, start, end, step, channel_id)
-        return list(block)
+        if (out is not None and out.dtype == np.int32 and out.size == num_points
+                and out.flags['C_CONTIGUOUS']):
+            self._GetBlock(out.ctypes.data, start, end, step, channel_id)
+            return out
+        
+        if num_points != self._block_buf_len:
+            self._block_buf = (c_int * num_points)()
+            self._block_buf_len = num_points
+        self._GetBlock(self._block_buf, start, end, step, channel_id)
+        
+        # The shared buffer is overwritten by the next call, so copy it out
+        if out is None:
+            out = np.empty(num_points, dtype=np.int32)
+            ctypes.memmove(out.ctypes.data, self._block_buf, ctypes.sizeof(self._block_buf))
+        else:
+            out[...] = np.frombuffer(self._block_buf, dtype=np.int32).reshape(out.shape)
+        return out
+
+    def get_blocks(self, channel_ranges: list, executor=None) -> list:
+        """
+        Retrieve full spectra for several channels into one contiguous buffer.
+        
+        All channels are read with GetBlock into consecutive slices of a single
+        int32 buffer, allocated once per call instead of once per channel.
+        
+        Args:
+            channel_ranges (list): (channel_id, range) pairs to read.
+            executor (concurrent.futures.Executor, optional): If given, the
+                GetBlock calls are submitted to it so the DLL round-trips of
+                the channels overlap. Each call writes a disjoint slice.
+        
+        Returns:
+            list: One int32 np.ndarray per entry, in the same order. The arrays
+            are views into a buffer owned by this call only, so callers may keep
+            them or hand them to another thread.
+        """
+        total = sum(max(length, 0) for _, length in channel_ranges)
+        # Deliberately a new buffer per call: the display queues these arrays for
+        # the Tk thread, caches them and hands short spectra to Line2D, which only
+        # converts them when it next draws. A reused (or double) buffer could be
+        # overwritten by a later poll while any of those still refers to it.
+        # np.empty costs one allocation per poll, not one per channel, and no fill.
+        buf = np.empty(total, dtype=np.int32)
+        base = buf.ctypes.data
+        itemsize = buf.itemsize
+        
+        blocks = []
+        futures = []
+        offset = 0
+        for channel_id, length in channel_ranges:
+            length = max(length, 0)
+            if length:
+                # GetBlock takes a c_void_p, so the slice address is passed as is
+                args = (base + offset * itemsize, 0, length, 1, channel_id)
+                if executor is None:
+                    self._GetBlock(*args)
+                else:
+                    futures.append(executor.submit(self._GetBlock, *args))
+            blocks.append(buf[offset:offset + length])
+            offset += length
+        
+        # Wait for every channel (and re-raise the first error) before returning
+        for future in futures:
+            future.result()
+        return blocks
 
     def set_range(self, new_range: int) -> None:
         """
@@ -275,8 +477,7 @@ class MCS8:
         Args:
             new_range (int): The new spectra length.
         """
-        command = f"range={new_range}"
-        self.run_cmd(command)
+        self.run_cmd(_RANGE_PREFIX + str(new_range).encode('ascii'))
 
     def run_command_loop(self) -> None:
         """
@@ -286,14 +487,45 @@ class MCS8:
         acquisition settings, board settings, data, and sending custom commands.
         """
         print("\nCommands: Q=Quit, H=Help, S=Status, T=AcqSetting, B=BoardSetting, D=Data, F=DatSetting")
+        
+        # stdin is read on a helper thread (selectors cannot wait on a console
+        # handle on Windows), so this thread can poll the status while idle.
+        # The reader only prompts again once the previous command is handled.
+        commands = queue.Queue()
+        ready = threading.Event()
+        ready.set()
+        
+        def read_commands():
+            while True:
+                ready.wait()
+                ready.clear()
+                try:
+                    commands.put(input("Enter command: "))
+                except EOFError:
+                    commands.put("Q")
+                    return
+        
+        threading.Thread(target=read_commands, daemon=True).start()
+        
+        status = None
+        status_time = 0.0
         while True:
-            command = input("Enter command: ").strip().upper()
+            try:
+                command = commands.get(timeout=self.CLI_POLL_INTERVAL).strip().upper()
+            except queue.Empty:
+                # Idle tick: keep the status fresh so S does not need another round-trip
+                status = self.get_status()
+                status_time = time.monotonic()
+                continue
+            
             if command == "Q":
                 break
             elif command == "H":
                 print("Commands: Q=Quit, H=Help, S=Status, T=AcqSetting, B=BoardSetting, D=Data, F=DatSetting")
             elif command == "S":
-                status = self.get_status()
+                if status is None or time.monotonic() - status_time > self.CLI_POLL_INTERVAL:
+                    status = self.get_status()
+                    status_time = time.monotonic()
                 self.print_status(status)
             elif command == "T":
                 acq = self.get_acq_setting()
@@ -305,113 +537,94 @@ class MCS8:
                 block = self.get_block(0, 30)
                 acq = self.get_acq_setting()
                 print(f"First 30 datapoints (acq range: {acq.range}):")
-                for pt in block:
-                    print(pt)
+                # One write instead of a print (and a NumPy scalar) per point
+                print("\n".join(map(str, block.tolist())))
             elif command == "F":
                 dat = self.get_dat_setting()
                 self.print_dat_setting(dat)
             else:
                 self.run_cmd(command)
+            ready.set()
+
+    # (cnt index, label) pairs for print_status
+    _STATUS_PRINT_FIELDS = (
+        (ST_TOTALSUM, 'total'), (ST_ROISUM, 'roi'), (ST_ROIRATE, 'rate'), (ST_OFLS, 'ofls'),
+    )
+    # (attribute, label) pairs for the print_* and *_text helpers below
+    _ACQ_PRINT_FIELDS = (
+        ('range', 'range'), ('cftfak', 'cftfak'), ('roimin', 'roimin'),
+        ('roimax', 'roimax'), ('nregions', 'nregions'), ('caluse', 'caluse'),
+        ('calpoints', 'calpoints'), ('active', 'active'), ('eventpreset', 'roipreset'),
+    )
+    _DAT_PRINT_FIELDS = (
+        ('savedata', 'savedata'), ('autoinc', 'autoinc'), ('fmt', 'fmt'),
+        ('mpafmt', 'mpafmt'), ('sephead', 'sephead'),
+    )
+    _BOARD_PRINT_FIELDS = (
+        ('sweepmode', 'sweepmode'), ('prena', 'prena'), ('cycles', 'cycles'),
+        ('sequences', 'sequences'), ('digio', 'digio'), ('digval', 'digval'),
+        ('dac0', 'dac0'), ('dac1', 'dac1'), ('dac2', 'dac2'), ('dac3', 'dac3'),
+        ('dac4', 'dac4'), ('dac5', 'dac5'), ('serno', 'serno'), ('ddruse', 'ddruse'),
+        ('active', 'active'), ('holdafter', 'holdafter'), ('swpreset', 'swpreset'),
+        ('fstchan', 'fstchan'), ('timepreset', 'timepreset'),
+    )
+    _ACQ_TEXT_FIELDS = (
+        ('range', 'Range'), ('cftfak', 'CFTFak'), ('roimin', 'ROI min'),
+        ('roimax', 'ROI max'), ('nregions', 'Regions'), ('caluse', 'Caluse'),
+        ('calpoints', 'Calpoints'), ('active', 'Active'), ('eventpreset', 'ROI Preset'),
+    )
+    _DAT_TEXT_FIELDS = (
+        ('savedata', 'Savedata'), ('autoinc', 'Autoinc'), ('fmt', 'Format'),
+        ('mpafmt', 'MPA Format'), ('sephead', 'SepHead'),
+    )
+    _BOARD_TEXT_FIELDS = (
+        ('sweepmode', 'Sweepmode'), ('prena', 'Prensa'), ('cycles', 'Cycles'),
+        ('sequences', 'Sequences'), ('digio', 'Digio'), ('digval', 'Digval'),
+        ('dac0', 'DAC0'), ('dac1', 'DAC1'), ('serno', 'SerNo'), ('active', 'Active'),
+        ('holdafter', 'HoldAfter'), ('swpreset', 'Swpreset'), ('fstchan', 'Fstchan'),
+        ('timepreset', 'Timepreset'),
+    )
 
     @classmethod
     def print_status(cls, status: ACQSTATUS) -> None:
-        print("Status:")
-        print("  total =", status.cnt[cls.ST_TOTALSUM])
-        print("  roi =", status.cnt[cls.ST_ROISUM])
-        print("  rate =", status.cnt[cls.ST_ROIRATE])
-        print("  ofls =", status.cnt[cls.ST_OFLS])
-
-    @staticmethod
-    def print_acq_setting(acq: ACQSETTING) -> None:
-        print("Acquisition Settings:")
-        print("  range =", acq.range)
-        print("  cftfak =", acq.cftfak)
-        print("  roimin =", acq.roimin)
-        print("  roimax =", acq.roimax)
-        print("  nregions =", acq.nregions)
-        print("  caluse =", acq.caluse)
-        print("  calpoints =", acq.calpoints)
-        print("  active =", acq.active)
-        print("  roipreset =", acq.eventpreset)
-
-    @staticmethod
-    def print_dat_setting(dat: DATSETTING) -> None:
+        print("Status:\n" + "\n".join(
+            f"  {label} = {status.cnt[index]}" for index, label in cls._STATUS_PRINT_FIELDS))
+
+    @classmethod
+    def print_acq_setting(cls, acq: ACQSETTING) -> None:
+        print("Acquisition Settings:\n" + "\n".join(
+            f"  {label} = {getattr(acq, name)}" for name, label in cls._ACQ_PRINT_FIELDS))
+
+    @classmethod
+    def print_dat_setting(cls, dat: DATSETTING) -> None:
         filename = dat.filename.decode("utf-8").rstrip("\x00")
-        print("Data Settings:")
-        print("  savedata =", dat.savedata)
-        print("  autoinc =", dat.autoinc)
-        print("  fmt =", dat.fmt)
-        print("  mpafmt =", dat.mpafmt)
-        print("  sephead =", dat.sephead)
-        print("  filename =", filename)
-
-    @staticmethod
-    def print_mcs_setting(board: BOARDSETTING) -> None:
-        print("Board Settings:")
-        print("  sweepmode =", board.sweepmode)
-        print("  prena =", board.prena)
-        print("  cycles =", board.cycles)
-        print("  sequences =", board.sequences)
-        print("  digio =", board.digio)
-        print("  digval =", board.digval)
-        print("  dac0 =", board.dac0)
-        print("  dac1 =", board.dac1)
-        print("  dac2 =", board.dac2)
-        print("  dac3 =", board.dac3)
-        print("  dac4 =", board.dac4)
-        print("  dac5 =", board.dac5)
-        print("  serno =", board.serno)
-        print("  ddruse =", board.ddruse)
-        print("  active =", board.active)
-        print("  holdafter =", board.holdafter)
-        print("  swpreset =", board.swpreset)
-        print("  fstchan =", board.fstchan)
-        print("  timepreset =", board.timepreset)
+        print("Data Settings:\n" + "\n".join(
+            f"  {label} = {getattr(dat, name)}" for name, label in cls._DAT_PRINT_FIELDS)
+            + f"\n  filename = {filename}")
+
+    @classmethod
+    def print_mcs_setting(cls, board: BOARDSETTING) -> None:
+        print("Board Settings:\n" + "\n".join(
+            f"  {label} = {getattr(board, name)}" for name, label in cls._BOARD_PRINT_FIELDS))
     
     # --- Helper methods for display (returning text strings) ---
+    # ctypes structs are not hashable, so the scalar fields are pulled into a
+    # tuple first and the formatting is memoized on that tuple. While the
+    # hardware is idle every refresh is then a cache hit.
     @classmethod
     def status_text(cls, status: ACQSTATUS) -> str:
-        return (f"Acquisition Started: {status.started}\n"
-                f"Max Value: {status.maxval}\n"
-                f"Runtime: {status.cnt[cls.ST_RUNTIME]}\n"
-                f"Sweeps: {status.cnt[cls.ST_SWEEPS]}\n"
-                f"Starts: {status.cnt[cls.ST_STARTS]}")
-
-    @staticmethod
-    def acq_setting_text(acq: ACQSETTING) -> str:
-        return (f"Range: {acq.range}\n"
-                f"CFTFak: {acq.cftfak}\n"
-                f"ROI min: {acq.roimin}\n"
-                f"ROI max: {acq.roimax}\n"
-                f"Regions: {acq.nregions}\n"
-                f"Caluse: {acq.caluse}\n"
-                f"Calpoints: {acq.calpoints}\n"
-                f"Active: {acq.active}\n"
-                f"ROI Preset: {acq.eventpreset}")
-
-    @staticmethod
-    def dat_setting_text(dat: DATSETTING) -> str:
-        fname = dat.filename.decode("utf-8").rstrip("\x00")
-        return (f"Savedata: {dat.savedata}\n"
-                f"Autoinc: {dat.autoinc}\n"
-                f"Format: {dat.fmt}\n"
-                f"MPA Format: {dat.mpafmt}\n"
-                f"SepHead: {dat.sephead}\n"
-                f"Filename: {fname}")
-
-    @staticmethod
-    def board_setting_text(board: BOARDSETTING) -> str:
-        return (f"Sweepmode: {board.sweepmode}\n"
-                f"Prensa: {board.prena}\n"
-                f"Cycles: {board.cycles}\n"
-                f"Sequences: {board.sequences}\n"
-                f"Digio: {board.digio}\n"
-                f"Digval: {board.digval}\n"
-                f"DAC0: {board.dac0}\n"
-                f"DAC1: {board.dac1}\n"
-                f"SerNo: {board.serno}\n"
-                f"Active: {board.active}\n"
-                f"HoldAfter: {board.holdafter}\n"
-                f"Swpreset: {board.swpreset}\n"
-                f"Fstchan: {board.fstchan}\n"
-                f"Timepreset: {board.timepreset}")
+        return _format_status((status.started, status.maxval, status.cnt[cls.ST_RUNTIME],
+                               status.cnt[cls.ST_SWEEPS], status.cnt[cls.ST_STARTS]))
+
+    @classmethod
+    def acq_setting_text(cls, acq: ACQSETTING) -> str:
+        return _format_fields(cls._ACQ_TEXT_FIELDS, _field_values(acq, cls._ACQ_TEXT_FIELDS))
+
+    @classmethod
+    def dat_setting_text(cls, dat: DATSETTING) -> str:
+        return _format_fields(cls._DAT_TEXT_FIELDS, _field_values(dat, cls._DAT_TEXT_FIELDS),
+                              ("Filename", dat.filename.decode("utf-8").rstrip("\x00")))
+
+    @classmethod
+    def board_setting_text(cls, board: BOARDSETTING) -> str:
+        return _format_fields(cls._BOARD_TEXT_FIELDS, _field_values(board, cls._BOARD_TEXT_FIELDS))
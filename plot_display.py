@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
-from matplotlib import pyplot as plt
+import matplotlib
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from mpl_toolkits.mplot3d import Axes3D
-from matplotlib.colors import LogNorm
+from matplotlib.colors import LogNorm, Normalize
 from typing import Tuple, List, Dict
 import time
 from mcs8_func import MCS8
@@ -14,6 +14,13 @@ import threading
 from dataclasses import dataclass
 from enum import Enum
 import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import xxhash  # Optional: much faster change detection than hashlib
+except ImportError:
+    xxhash = None
 
 class MCSDisplay:
     def __init__(self, tab_display: ttk.Frame, mcs: 'MCS8'):
@@ -24,18 +31,35 @@ class MCSDisplay:
         self.lines = {}  # Dictionary to store line objects by channel
         self.images = {}  # Dictionary to store 2D/3D image/surface objects
         self.canvas = None
+        self.toolbar = None
         self.notebook = None
+        self.main_tab = None
         self.colormaps = ['gist_ncar', 'hot', 'viridis', 'plasma', 'inferno', 'magma', 'jet', 'rainbow', 'coolwarm', 'twilight']
         
         # Cache for channel data to detect changes
-        self.channel_cache = {}
-        self.active_channels_cache = set()
+        self.channel_sig = {}  # Channel -> (shape, dtype, content digest) of the data last plotted
+        self.active_channels_cache = ()  # Active channel ids (in read order) of the current layout
+        # (status/settings key, (active_channels, channel_data, is2d)) of the last channel
+        # read; shared by the Tk and update threads, so only touched under the lock
+        self._channel_data_cache = None
+        self._channel_data_lock = threading.Lock()
+        self._channel_settings = None  # (settings generation, read time, [(channel, range, xdim)])
+        self.settings_refresh_interval = 2.0  # Re-read channel settings at least this often (seconds)
+        self._reported_errors = set()  # Messages already printed by _report_error
+        self._prep_buf = {}  # Channel -> float buffer reused by live 2D image updates
+        self._x_cache = {}  # Shared read-only x-axis arrays keyed by length (or length, step)
+        self.display_points = 2000  # Envelope bins per 1D line when the axes width is unknown
+        # Concurrent GetBlock calls; off until the DLL is confirmed to be thread-safe
+        # (the calls only overlap if MCS8.DLL_THREAD_SAFE is set as well)
+        self.parallel_block_reads = False
+        self._block_pool = None  # Created on first use when parallel_block_reads is set
         self.last_update_time = 0
         self.update_interval = 0.1  # Minimum time between updates (seconds)
         
         # Performance flags
         self.use_blitting = True  # Enable blitting for faster updates
-        self.background = None
+        self._backgrounds = {}  # Per-channel axes backgrounds captured on each full draw
+        self._blit_artists = ()  # Animated lines in plot order, redrawn after each full draw
 
         self.fixed_ylims = {}  # Dictionary to store fixed y-limits by channel
         self.y_axis_fixed = True  # Flag to enable/disable fixed y-axis
@@ -44,13 +68,79 @@ class MCSDisplay:
         self._setup_plot_params()
         self.create_display()
         self._isplaying = False
+        self._after_id = None  # Pending after() id of the periodic update tick
     
     def _set_playing(self):
         self._isplaying = False
+        if self._after_id is not None:
+            self.tab_display.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _x_axis(self, length: int) -> np.ndarray:
+        """Return a cached np.arange(length) for use as line x-data"""
+        x_data = self._x_cache.get(length)
+        if x_data is None:
+            x_data = np.arange(length)
+            x_data.setflags(write=False)
+            self._x_cache[length] = x_data
+        return x_data
+
+    def _envelope_x(self, length: int, step: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return cached (bin starts, x-data) for a min/max envelope of a spectrum"""
+        key = (length, step)
+        cached = self._x_cache.get(key)
+        if cached is None:
+            starts = np.arange(0, length, step)
+            x_data = np.repeat(starts, 2)
+            x_data.setflags(write=False)
+            cached = self._x_cache[key] = (starts, x_data)
+        return cached
+
+    def _display_bins(self, ax) -> int:
+        """Return how many envelope bins to draw on ax: one per pixel column"""
+        width = int(ax.bbox.width)
+        return width if width > 0 else self.display_points
+
+    def _line_xy(self, data: np.ndarray, data_range: tuple = None, bins: int = None) -> tuple:
+        """Return (x, y, data_min, data_max) line data for a spectrum
+        
+        Spectra longer than 2 * bins (default display_points) are split into bins
+        and drawn as the minimum and maximum of each bin, so peaks survive while
+        the renderer only sees about 2 * bins vertices. The overall min/max then come from
+        the bin extrema, so the full spectrum is only scanned by the two reduceat
+        passes. data_range can be passed if the caller already knows it.
+        """
+        length = len(data)
+        step = length // (bins or self.display_points)
+        if step < 2:
+            data_min, data_max = data_range or (np.min(data), np.max(data))
+            return self._x_axis(length), data, data_min, data_max
+        
+        starts, x_data = self._envelope_x(length, step)
+        y_data = np.empty(2 * len(starts), dtype=data.dtype)
+        y_data[0::2] = bin_min = np.minimum.reduceat(data, starts)
+        y_data[1::2] = bin_max = np.maximum.reduceat(data, starts)
+        data_min, data_max = data_range or (bin_min.min(), bin_max.max())
+        return x_data, y_data, data_min, data_max
+
+    @staticmethod
+    def _data_fingerprint(data: np.ndarray) -> tuple:
+        """Return (shape, dtype, 64-bit digest) identifying the contents of data
+        
+        The digest is taken over the array's buffer in one pass without copying
+        it, so unchanged spectra are detected without keeping a copy around.
+        XXH3 is used when xxhash is installed, BLAKE2b otherwise.
+        """
+        buf = np.ascontiguousarray(data)
+        if xxhash is not None:
+            digest = xxhash.xxh3_64_intdigest(buf)
+        else:
+            digest = hashlib.blake2b(buf, digest_size=8).digest()
+        return data.shape, data.dtype.str, digest
         
     def _setup_plot_params(self):
         """Set up matplotlib parameters for better performance and compact layout"""
-        plt.rcParams.update({
+        matplotlib.rcParams.update({
             'font.size': 8,
             'axes.titlesize': 9,
             'axes.labelsize': 8,
@@ -78,19 +168,27 @@ class MCSDisplay:
         # Clear existing display
         self._clear_display()
         
-        # Get initial channel data
+        # Get initial channel data (always read fresh, e.g. after loading a file)
+        with self._channel_data_lock:
+            self._channel_data_cache = None
+        self._channel_settings = None
+        self._reported_errors.clear()
         active_channels, channel_data, is2d = self._get_channel_data()
         
-        # Create notebook for tabs
-        self.notebook = ttk.Notebook(self.tab_display)
-        self.notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Create main tab
-        main_tab = ttk.Frame(self.notebook)
-        self.notebook.add(main_tab, text="All Channels")
+        # Create notebook and main tab once; later rebuilds reuse them
+        if self.notebook is None:
+            self.notebook = ttk.Notebook(self.tab_display)
+            self.notebook.pack(fill=tk.BOTH, expand=True)
+            
+            self.main_tab = ttk.Frame(self.notebook)
+            self.notebook.add(self.main_tab, text="All Channels")
+            
+            # Hidden tabs are not updated, so bring the newly shown one up to date
+            self.notebook.bind("<<NotebookTabChanged>>",
+                               lambda e: self.tab_display.after_idle(self.update_plot, True))
         
         # Create the figure and initial plots
-        self._create_figure_and_plots(active_channels, channel_data, main_tab, is2d)
+        self._create_figure_and_plots(active_channels, channel_data, self.main_tab, is2d)
         
         # Create 2D/3D tabs if needed
         for idx, channel in enumerate(active_channels):
@@ -98,16 +196,27 @@ class MCSDisplay:
                 self._create_2d_3d_tab(channel, channel_data[channel])
         
         # Cache the current state
-        self.active_channels_cache = set(active_channels)
+        self.active_channels_cache = tuple(active_channels)
         
         return self.fig, self.axes, self.canvas
     
     def preiodic_update(self):
-        """Periodic update method to refresh the display"""
-        while(self._isplaying):
-            self.update_plot(force=False, rebuild=False)
-            # wait 1 second before next update
-            time.sleep(1)
+        """Periodic update method to refresh the display
+        
+        Updates run as Tk after() callbacks on the GUI thread, once per second
+        while _isplaying is set, instead of in a sleeping loop.
+        """
+        if self._after_id is None:
+            self._periodic_tick()
+
+    def _periodic_tick(self):
+        """One periodic update; reschedules itself while playing"""
+        self._after_id = None
+        if not self._isplaying:
+            return
+        self.update_plot(force=False, rebuild=False)
+        # wait 1 second before next update
+        self._after_id = self.tab_display.after(1000, self._periodic_tick)
 
     def _create_figure_and_plots(self, active_channels: List[int], channel_data: Dict[int, np.ndarray], 
                                 parent_frame: ttk.Frame, is2d: List[bool]):
@@ -116,6 +225,9 @@ class MCSDisplay:
         channels_1d = [(ch, idx) for idx, ch in enumerate(active_channels) if not is2d[idx]]
         
         if not channels_1d:
+            # Show the cleared figure if the canvas already exists
+            if self.canvas:
+                self.canvas.draw_idle()
             return
         
         num_channels = len(channels_1d)
@@ -125,27 +237,20 @@ class MCSDisplay:
         plot_bg_color = (36/255, 255/255, 255/255, 100/255)  # Cyan with transparency
         # Alternative if alpha is out of 100: plot_bg_color = (36/255, 255/255, 255/255, 1.0)
         
-        # Create figure with appropriate size
-        fig_height = max(3, min(8, 2 + num_channels * 1.5))  # Dynamic height based on channel count
-        fig_width = 10
-        self.fig = Figure(figsize=(fig_width, fig_height), dpi=100)
+        # Create figure with appropriate size (only once, it is cleared and reused on rebuild)
+        if self.fig is None:
+            fig_height = max(3, min(8, 2 + num_channels * 1.5))  # Dynamic height based on channel count
+            fig_width = 10
+            self.fig = Figure(figsize=(fig_width, fig_height), dpi=100)
         
-        # Store reference to shared x-axis
-        shared_ax = None
+        # Create all subplots with a shared x-axis in one call (one gridspec layout)
+        if num_channels == 1:
+            axes_list = [self.fig.add_subplot(111)]
+        else:
+            axes_list = self.fig.subplots(num_channels, 1, sharex=True, squeeze=False).ravel()
         
-        # Create subplots with shared x-axis and minimal spacing
         for plot_idx, (channel, data_idx) in enumerate(channels_1d):
-            if num_channels == 1:
-                ax = self.fig.add_subplot(111)
-                shared_ax = ax
-            else:
-                if plot_idx == 0:
-                    # First subplot - this will be the shared x-axis reference
-                    ax = self.fig.add_subplot(num_channels, 1, plot_idx + 1)
-                    shared_ax = ax
-                else:
-                    # Subsequent subplots share x-axis with the first
-                    ax = self.fig.add_subplot(num_channels, 1, plot_idx + 1, sharex=shared_ax)
+            ax = axes_list[plot_idx]
             
             # Set subplot background color (plot area only)
             ax.set_facecolor(plot_bg_color)
@@ -163,18 +268,19 @@ class MCSDisplay:
             colors = ['#000080', '#8B0000', '#006400', '#8B008B', '#FF4500', '#4B0082', '#B22222', '#2F4F4F']
             color = colors[plot_idx % len(colors)]
             
-            line, = ax.plot([], [], color=color, linewidth=1.2, label=f'Channel {channel}')  # Slightly thicker lines
+            # Animated lines are left out of full draws so they can be blitted over a clean background
+            line, = ax.plot([], [], color=color, linewidth=1.2, label=f'Channel {channel}',  # Slightly thicker lines
+                            animated=self.use_blitting)
             self.lines[channel] = line
             
             # Set initial data
-            x_data = np.arange(len(data))
-            line.set_data(x_data, data)
+            x_data, y_data, data_min, data_max = self._line_xy(data, bins=self._display_bins(ax))
+            line.set_data(x_data, y_data)
             
             # Configure axis
             ax.set_xlim(0, len(data))
             
             # Set y-limits with better handling of edge cases
-            data_min, data_max = np.min(data), np.max(data)
 
             if data_min == data_max:
                 # Handle constant data
@@ -214,8 +320,10 @@ class MCSDisplay:
                 spine.set_color('black')
                 spine.set_linewidth(1)
             
-            # Cache the data
-            self.channel_cache[channel] = data.copy()
+            # Remember what was plotted
+            self.channel_sig[channel] = self._data_fingerprint(data)
+        
+        self._blit_artists = tuple(self.lines.values())
         
         # Adjust layout with minimal spacing
         if num_channels == 1:
@@ -230,20 +338,50 @@ class MCSDisplay:
                 hspace=0.2    # Minimal vertical spacing between subplots
             )
         
-        # Create canvas
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent_frame)
+        # Create canvas and toolbar on first use only
+        if self.canvas is None:
+            self.canvas = FigureCanvasTkAgg(self.fig, master=parent_frame)
+            
+            self.toolbar = NavigationToolbar2Tk(self.canvas, parent_frame)
+            self.toolbar.update()
+            
+            # Pack canvas
+            self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+            
+            # Blit backgrounds are recaptured after every full draw and dropped on resize
+            self.canvas.mpl_connect('draw_event', self._on_draw)
+            self.canvas.mpl_connect('resize_event', self._on_resize)
+        else:
+            # Reset the toolbar's zoom/pan history for the new axes
+            self.toolbar.update()
         self.canvas.draw()
+
+    def _on_draw(self, event):
+        """After a full draw: capture clean axes backgrounds and draw the animated lines on top"""
+        if not self.use_blitting:
+            return
+        self._backgrounds = {channel: self.canvas.copy_from_bbox(ax.bbox)
+                             for channel, ax in self.axes.items()}
+        for line in self._blit_artists:
+            line.axes.draw_artist(line)
+
+    def _on_resize(self, event):
+        """Drop blit backgrounds; the redraw after the resize captures new ones"""
+        self._backgrounds.clear()
+
+    def _blit_lines(self, channels) -> bool:
+        """Redraw only the given channels' lines over their cached backgrounds
         
-        # Create toolbar
-        toolbar = NavigationToolbar2Tk(self.canvas, parent_frame)
-        toolbar.update()
-        
-        # Pack canvas
-        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
-        
-        # Store background for blitting
-        if self.use_blitting:
-            self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        Returns False if blitting is not possible and a full draw is needed instead.
+        """
+        if not self.use_blitting or any(ch not in self._backgrounds for ch in channels):
+            return False
+        for channel in channels:
+            ax = self.axes[channel]
+            self.canvas.restore_region(self._backgrounds[channel])
+            ax.draw_artist(self.lines[channel])
+            self.canvas.blit(ax.bbox)
+        return True
 
     def update_plot(self, force: bool = False, rebuild: bool = False):
         """Update the plot with new data
@@ -268,10 +406,10 @@ class MCSDisplay:
             
             # Get current data
             active_channels, channel_data, is2d = self._get_channel_data()
-            active_set = set(active_channels)
             
-            # Check if channel configuration has changed
-            if active_set != self.active_channels_cache:
+            # Check if channel configuration has changed (channels are always read
+            # in ascending order, so comparing tuples is enough)
+            if tuple(active_channels) != self.active_channels_cache:
                 # Full rebuild needed
                 print("Channel configuration changed, rebuilding display...")
                 self.create_display()
@@ -279,17 +417,16 @@ class MCSDisplay:
             
             # Check if data dimensions have changed for any channel
             for channel in active_channels:
-                if channel in self.channel_cache:
-                    old_shape = self.channel_cache[channel].shape
+                if channel in self.channel_sig:
+                    old_shape = self.channel_sig[channel][0]
                     new_shape = channel_data[channel].shape
                     if old_shape != new_shape:
                         print(f"Data dimensions changed for channel {channel}, rebuilding display...")
                         self.create_display()
                         return
             
-            # Update existing plots
+            # Update existing plots in place (no figure rebuild, no forced full draw)
             self._update_existing_plots(active_channels, channel_data, is2d)
-            self.reset_canvas()  # Reset canvas to apply changes
             
         except Exception as e:
             print(f"Error updating plot: {e}")
@@ -302,23 +439,29 @@ class MCSDisplay:
     def reset_canvas(self):
         """Simuliert den Effekt des Home-Buttons: vollständige Neuzeichnung und Reset des Blitting"""
         if self.canvas:
-            # Erzwinge vollständige Neuzeichnung
-            self.canvas.draw()
-            
-            # Aktualisiere den Blitting-Hintergrund
-            self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+            # Vollständige Neuzeichnung beim nächsten Leerlauf; _on_draw nimmt
+            # danach die Blitting-Hintergründe pro Achse neu auf
+            self.canvas.draw_idle()
 
     def _update_existing_plots(self, active_channels: List[int], channel_data: Dict[int, np.ndarray], 
                               is2d: List[bool]):
         """Update only the data in existing plots with improved y-axis scaling"""
-        updated = False
+        updated_channels = []
+        rescaled = False  # Axis limits changed, so the static background must be redrawn
+        
+        # Only the visible tab is updated: the 1D lines on the main tab or one 2D/3D image
+        selected_tab = self.notebook.select() if self.notebook is not None else ''
+        main_tab_visible = not selected_tab or selected_tab == str(self.main_tab)
         
         # Update 1D plots
         for idx, channel in enumerate(active_channels):
             if is2d[idx]:
                 # Update 2D/3D plots
-                if channel in self.images:
-                    self._update_2d_3d_image(channel)
+                if channel in self.images and str(self.images[channel]['tab']) == selected_tab:
+                    self._update_2d_3d_image(channel, channel_data[channel])
+                continue
+            
+            if not main_tab_visible:
                 continue
             
             data = channel_data[channel]
@@ -326,59 +469,47 @@ class MCSDisplay:
                 data = data[0]
             
             # Check if data has changed
-            if channel not in self.channel_cache or not np.array_equal(data, self.channel_cache[channel]):
+            signature = self._data_fingerprint(data)
+            previous = self.channel_sig.get(channel)
+            if signature != previous:
                 # Update line data
                 if channel in self.lines:
                     line = self.lines[channel]
-                    line.set_ydata(data)
+                    ax = self.axes[channel]
+                    x_data, y_data, data_min, data_max = self._line_xy(data, bins=self._display_bins(ax))
+                    line.set_data(x_data, y_data)
                     
                     # Update axis limits with better scaling
-                    ax = self.axes[channel]
                     
                     # Update x-axis if data length changed
-                    if len(data) != len(self.channel_cache.get(channel, [])):
-                        x_data = np.arange(len(data))
-                        line.set_xdata(x_data)
+                    if previous is None or previous[0] != data.shape:
                         ax.set_xlim(0, len(data))
+                        rescaled = True
                     
-                    # Smart y-axis scaling
-                    data_min, data_max = np.min(data), np.max(data)
-                    
-                    if data_min == data_max:
-                        # Handle constant data
-                        y_margin = max(1, abs(data_min) * 0.1)
-                        new_ylim = (data_min - y_margin, data_max + y_margin)
-                    else:
-                        # Calculate range with reduced margin for compact view
-                        y_range = data_max - data_min
-                        margin = y_range * 0.05  # Smaller margin
-                        new_ylim = (data_min - margin, data_max + margin)
-                    
-                    # Only update if the change is significant to avoid constant rescaling
-                    current_ylim = ax.get_ylim()
-                    ylim_change = abs(new_ylim[0] - current_ylim[0]) / (current_ylim[1] - current_ylim[0])
-                    ylim_change += abs(new_ylim[1] - current_ylim[1]) / (current_ylim[1] - current_ylim[0])
-                    
-                    if ylim_change > 0.1:  # Only update if change is > 10%
+                    # Smart y-axis scaling with hysteresis: keep the limits while the
+                    # data stays inside them and fills at least half of the band.
+                    # Every rescale costs a full redraw instead of a blit.
+                    y_low, y_high = ax.get_ylim()
+                    if (data_min < y_low or data_max > y_high
+                            or (data_max - data_min) < 0.5 * (y_high - y_low)):
+                        if data_min == data_max:
+                            # Handle constant data
+                            y_margin = max(1, abs(data_min) * 0.1)
+                            new_ylim = (data_min - y_margin, data_max + y_margin)
+                        else:
+                            # Small margin below, headroom above so growing counts stay in the band
+                            y_range = data_max - data_min
+                            new_ylim = (data_min - y_range * 0.05, data_max + y_range * 0.2)
                         ax.set_ylim(new_ylim)
+                        rescaled = True
                     
-                    # Cache new data
-                    self.channel_cache[channel] = data.copy()
-                    updated = True
-        
-        if updated:
-            if self.use_blitting and self.background is not None:
-                # Restore background
-                self.canvas.restore_region(self.background)
-                
-                # Redraw all lines
-                for line in self.lines.values():
-                    line.axes.draw_artist(line)
-                
-                # Blit
-                self.canvas.blit(self.fig.bbox)
-            else:
-                # Regular draw
+                    self.channel_sig[channel] = signature
+                    updated_channels.append(channel)
+        
+        if updated_channels and self.canvas:
+            # Blit just the changed lines; fall back to one deferred full draw
+            # when limits changed or no background is available yet
+            if rescaled or not self._blit_lines(updated_channels):
                 self.canvas.draw_idle()
 
     def _create_2d_3d_tab(self, channel: int, data: np.ndarray):
@@ -401,7 +532,7 @@ class MCSDisplay:
             control_frame, 
             text="Log Scale", 
             variable=log_var,
-            command=lambda: self._update_2d_3d_plot_full(channel)
+            command=lambda: self._restyle_2d_3d(channel)
         )
         log_check.pack(side=tk.LEFT, padx=10)
         
@@ -427,7 +558,7 @@ class MCSDisplay:
             state="readonly"
         )
         cmap_combo.pack(side=tk.LEFT, padx=5)
-        cmap_combo.bind("<<ComboboxSelected>>", lambda e: self._update_2d_3d_plot_full(channel))
+        cmap_combo.bind("<<ComboboxSelected>>", lambda e: self._restyle_2d_3d(channel))
         
         # 3D specific controls
         stride_var = tk.IntVar(value=1)
@@ -443,6 +574,16 @@ class MCSDisplay:
         )
         stride_spin.pack(side=tk.LEFT, padx=5)
         
+        # Smooth (antialiased, shaded) 3D rendering is slow; off by default, e.g. for screenshots
+        smooth_3d_var = tk.BooleanVar(value=False)
+        smooth_3d_check = ttk.Checkbutton(
+            control_frame,
+            text="Smooth 3D",
+            variable=smooth_3d_var,
+            command=lambda: self._update_3d_stride(channel)
+        )
+        smooth_3d_check.pack(side=tk.LEFT, padx=10)
+        
         # Create plot frame
         plot_frame = ttk.Frame(tab_2d_3d)
         plot_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -501,6 +642,7 @@ class MCSDisplay:
             'cmap_var': cmap_var,
             'mode_3d_var': mode_3d_var,
             'stride_var': stride_var,
+            'smooth_3d_var': smooth_3d_var,
             'tab': tab_2d_3d,
             'plot_frame': plot_frame,
             'is_3d': False,
@@ -548,7 +690,7 @@ class MCSDisplay:
             
             # Redraw
             img_info['fig'].tight_layout(pad=3.0)
-            img_info['canvas'].draw()
+            img_info['canvas'].draw_idle()
             
         except Exception as e:
             print(f"Error toggling 3D mode for channel {channel}: {e}")
@@ -642,29 +784,32 @@ class MCSDisplay:
         use_log = img_info['log_var'].get()
         cmap = img_info['cmap_var'].get()
         stride = img_info['stride_var'].get()
+        smooth = img_info['smooth_3d_var'].get()
+        
+        # Downsample according to stride first, so the log only runs on the kept points
+        sub = data_plot[::stride, ::stride]
         
         # Apply log scale if needed
         if use_log:
-            z_data = np.log10(data_plot + 1e-10)
+            Z = np.log10(sub + 1e-10)
         else:
-            z_data = data_plot
+            Z = sub
         
-        # Create meshgrid
+        # Sparse grid of the original pixel positions (plot_surface broadcasts it)
         y_size, x_size = data_plot.shape
-        x = np.arange(0, x_size, stride)
-        y = np.arange(0, y_size, stride)
-        X, Y = np.meshgrid(x, y)
-        
-        # Downsample Z data according to stride
-        Z = z_data[::stride, ::stride]
+        X, Y = np.meshgrid(np.arange(0, x_size, stride), np.arange(0, y_size, stride),
+                           sparse=True, copy=False)
         
-        # Create 3D surface
+        # Create 3D surface (per-face antialiasing, shading and alpha are the
+        # dominant rendering costs, so they are only used for smooth rendering)
         surface = ax.plot_surface(
             X, Y, Z,
             cmap=cmap,
-            alpha=0.9,
+            alpha=0.9 if smooth else None,
             linewidth=0,
-            antialiased=True,
+            edgecolor='none',
+            antialiased=smooth,
+            shade=smooth,
             rcount=min(50, Z.shape[0]),  # Limit resolution for performance
             ccount=min(50, Z.shape[1])
         )
@@ -687,7 +832,7 @@ class MCSDisplay:
         ax.view_init(elev=30, azim=45)
 
     def _update_3d_stride(self, channel: int):
-        """Update 3D plot when stride changes"""
+        """Update 3D plot when stride or smooth rendering changes"""
         if channel not in self.images:
             return
         
@@ -695,19 +840,52 @@ class MCSDisplay:
         if img_info['is_3d']:
             self._update_2d_3d_plot_full(channel)
 
-    def _prepare_2d_data(self, data: np.ndarray) -> np.ndarray:
-        """Prepare 2D data for plotting"""
-        data_plot = data.copy()
+    def _prepare_2d_data(self, data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Prepare 2D data for plotting, into out if its shape and dtype fit
         
+        Counts that float32 represents exactly (below 2**24) are prepared as
+        float32, which matplotlib then keeps for resampling and normalization,
+        halving the bytes moved per redraw. Larger values stay float64.
+        """
         # Ensure non-negative values
-        min_val = np.min(data_plot)
-        if min_val < 0:
-            data_plot = data_plot - min_val
+        min_val = np.min(data)
+        shift = min_val if min_val < 0 else 0
+        dtype = np.float32 if np.max(data) - shift < 2 ** 24 else np.float64
+        if out is not None and (out.shape != data.shape or out.dtype != dtype):
+            out = None
+        
+        # Shift and add a small epsilon for log scale in one pass
+        return np.subtract(data, shift - 1e-10, out=out, dtype=dtype)
+
+    @staticmethod
+    def _image_norm(data_plot: np.ndarray, use_log: bool):
+        """Return the norm for a 2D image of data_plot: log or linear over its full range"""
+        if use_log:
+            return LogNorm(vmin=max(data_plot.min(), 1e-10), vmax=data_plot.max())
+        return Normalize(vmin=data_plot.min(), vmax=data_plot.max())
+
+    def _restyle_2d_3d(self, channel: int):
+        """Apply log-scale and colormap changes (for UI controls)
         
-        # Add small epsilon for log scale
-        data_plot = data_plot + 1e-10
+        In 2D mode the existing image is kept and only its norm and colormap are
+        swapped; the colorbar follows the image. The 3D surface has to be rebuilt.
+        """
+        if channel not in self.images:
+            return
         
-        return data_plot
+        img_info = self.images[channel]
+        if img_info['is_3d'] or img_info['im'] is None:
+            self._update_2d_3d_plot_full(channel)
+            return
+        
+        try:
+            im = img_info['im']
+            im.set_cmap(img_info['cmap_var'].get())
+            im.set_norm(self._image_norm(im.get_array(), img_info['log_var'].get()))
+            img_info['canvas'].draw_idle()
+        except Exception as e:
+            print(f"Error restyling 2D image for channel {channel}: {e}")
+            self._update_2d_3d_plot_full(channel)
 
     def _update_2d_3d_plot_full(self, channel: int):
         """Completely redraw 2D/3D plot with new settings (for UI controls)"""
@@ -734,7 +912,7 @@ class MCSDisplay:
             
             # Update layout and redraw
             img_info['fig'].tight_layout(pad=3.0)
-            img_info['canvas'].draw()
+            img_info['canvas'].draw_idle()
             
         except Exception as e:
             print(f"Error updating 2D/3D plot for channel {channel}: {e}")
@@ -745,24 +923,29 @@ class MCSDisplay:
                 ax.text(0.5, 0.5, f'Error displaying Channel {channel}', 
                        ha='center', va='center', transform=ax.transAxes)
                 img_info['ax'] = ax
-                img_info['canvas'].draw()
+                img_info['canvas'].draw_idle()
             except Exception as e2:
                 print(f"Error during fallback display: {e2}")
 
-    def _update_2d_3d_image(self, channel: int):
-        """Update 2D/3D image data efficiently (for automatic updates)"""
+    def _update_2d_3d_image(self, channel: int, data: np.ndarray = None):
+        """Update 2D/3D image data efficiently (for automatic updates)
+        
+        Callers that already read the channels pass the channel's data, so the
+        device is only read again when data is None.
+        """
         if channel not in self.images:
             return
         
         img_info = self.images[channel]
         
-        # Get current data
-        active_channels, channel_data, _ = self._get_channel_data()
-        
-        if channel not in channel_data:
-            return
-        
-        data = channel_data[channel]
+        if data is None:
+            # Get current data
+            active_channels, channel_data, _ = self._get_channel_data()
+            
+            if channel not in channel_data:
+                return
+            
+            data = channel_data[channel]
         
         if data is None or data.ndim <= 1:
             return
@@ -772,22 +955,26 @@ class MCSDisplay:
         if img_info['is_3d']:
             return  # Skip automatic updates for 3D
         
-        # Prepare data
-        data_plot = self._prepare_2d_data(data)
+        # Prepare data into this channel's reused buffer (set_data copies it into the image)
+        data_plot = self._prepare_2d_data(data, out=self._prep_buf.get(channel))
+        self._prep_buf[channel] = data_plot
         
         # Update 2D image data
         if img_info['im'] is not None:
             try:
                 img_info['im'].set_data(data_plot)
                 
-                # Update normalization based on current settings
+                # Update normalization based on current settings; a norm of the
+                # right kind is retargeted in place instead of being replaced
+                im = img_info['im']
                 use_log = img_info['log_var'].get()
-                
-                if use_log:
-                    img_info['im'].set_norm(LogNorm(vmin=max(data_plot.min(), 1e-10), vmax=data_plot.max()))
+                if type(im.norm) is (LogNorm if use_log else Normalize):
+                    vmin, vmax = data_plot.min(), data_plot.max()
+                    im.norm.vmin = max(vmin, 1e-10) if use_log else vmin
+                    im.norm.vmax = vmax
+                    im.changed()
                 else:
-                    img_info['im'].set_norm(None)
-                    img_info['im'].set_clim(vmin=data_plot.min(), vmax=data_plot.max())
+                    im.set_norm(self._image_norm(data_plot, use_log))
                 
                 # Redraw
                 img_info['canvas'].draw_idle()
@@ -797,16 +984,23 @@ class MCSDisplay:
                 self._update_2d_3d_plot_full(channel)
 
     def _clear_display(self):
-        """Clear the display"""
+        """Clear the plot contents, keeping the notebook, canvas and toolbar for reuse"""
         # Clear references
         self.lines.clear()
         self.axes.clear()
         self.images.clear()
-        self.channel_cache.clear()
-        
-        # Destroy widgets
-        for widget in self.tab_display.winfo_children():
-            widget.destroy()
+        self.channel_sig.clear()
+        self._backgrounds.clear()
+        self._blit_artists = ()
+        
+        # Clear the main figure in place
+        if self.fig is not None:
+            self.fig.clear()
+        
+        # Only the per-channel 2D/3D tabs are destroyed; they are rebuilt as needed
+        if self.notebook is not None:
+            for tab_id in self.notebook.tabs()[1:]:
+                self.notebook.nametowidget(tab_id).destroy()
     
 
 
@@ -819,16 +1013,63 @@ class MCSDisplay:
         print("Forcing complete display rebuild...")
         
         # Clear all caches
-        self.channel_cache.clear()
-        self.active_channels_cache.clear()
+        self.channel_sig.clear()
+        self.active_channels_cache = ()
         self.lines.clear()
         self.axes.clear()
         self.images.clear()
-        self.background = None
+        self._backgrounds.clear()
         
         # Rebuild from scratch
         self.create_display()
 
+    def _report_error(self, message: str):
+        """Print an error from the polling path once instead of on every poll
+        
+        A persistent fault (e.g. the server going away) otherwise prints the same
+        lines 16 times per poll and the console output throttles the update thread.
+        The record is cleared on each create_display.
+        """
+        if message in self._reported_errors:
+            return
+        if len(self._reported_errors) >= 256:
+            self._reported_errors.clear()
+        self._reported_errors.add(message)
+        print(message)
+
+    def _get_block_pool(self):
+        """Return the executor for parallel GetBlock calls, or None for sequential reads"""
+        if not self.parallel_block_reads:
+            return None
+        if self._block_pool is None:
+            self._block_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mcs8-getblock")
+        return self._block_pool
+
+    def _read_channel_settings(self) -> List[Tuple[int, int, int]]:
+        """Return (channel, range, xdim) of all channels
+        
+        The 16 GetSettingData calls are only repeated when a command was sent
+        through run_cmd since the last read, or after settings_refresh_interval
+        to pick up changes made in the MCS8 server itself.
+        """
+        generation = self.mcs.settings_generation
+        now = time.monotonic()
+        cached = self._channel_settings
+        if (cached is not None and cached[0] == generation
+                and now - cached[1] < self.settings_refresh_interval):
+            return cached[2]
+        
+        channel_settings = []
+        for channel in range(16):
+            try:
+                acq = self.mcs.get_acq_setting(channel)
+                channel_settings.append((channel, acq.range, getattr(acq, 'xdim', 0)))
+            except Exception as e:
+                self._report_error(f"Error reading settings of channel {channel}: {e}")
+        
+        self._channel_settings = (generation, now, channel_settings)
+        return channel_settings
+
     def _get_channel_data(self) -> Tuple[List[int], Dict[int, np.ndarray], List[bool]]:
         """Get channel data from MCS8 with robust handling for 8 channels"""
         active_channels = []
@@ -836,23 +1077,30 @@ class MCSDisplay:
         is2d = []
         
         try:
-
-            # Check all 8 channels (0-7) for MCS8
-            for channel in range(16):
+            # Read the settings of all channels first, then fetch every
+            # spectrum into one shared buffer with a single get_blocks call
+            channel_settings = self._read_channel_settings()
+            
+            # While the device is halted and neither its counters nor the channel
+            # layout moved, the spectra cannot have changed: reuse the last read
+            status = self.mcs.get_status()
+            key = (status.cnt[MCS8.ST_TOTALSUM], status.cnt[MCS8.ST_SWEEPS],
+                   status.cnt[MCS8.ST_STARTS], tuple(channel_settings))
+            if not status.started:
+                with self._channel_data_lock:
+                    cached = self._channel_data_cache
+                if cached is not None and cached[0] == key:
+                    return cached[1]
+            
+            # ctypes releases the GIL around GetBlock, so with parallel_block_reads
+            # the channels are read concurrently; otherwise one after the other
+            blocks = self.mcs.get_blocks([(ch, range_val) for ch, range_val, _ in channel_settings],
+                                         executor=self._get_block_pool())
+            
+            for (channel, range_val, xdim), data_array in zip(channel_settings, blocks):
                 try:
-                    # Get acquisition settings
-                    acq = self.mcs.get_acq_setting(channel)
-                    range_val = acq.range
-                    xdim = getattr(acq, 'xdim', 0)
-
-                    # Get data for this channel
-                    data = self.mcs.get_block(0, range_val, channel_id=channel)
-                    
-                    # Convert to numpy array for consistency
-                    data_array = np.array(data)
-                    
                     # Check if channel has meaningful data
-                    if np.any(data_array != 0):
+                    if data_array.any():
                         
                         # Check if this might be 2D data
                         # For MCS8, this would need to be determined based on your specific setup
@@ -871,14 +1119,19 @@ class MCSDisplay:
                         is2d.append(is_2d_channel)
                         
                 except Exception as e:
-                    print(f"Error reading data from channel {channel}: {e}")
+                    self._report_error(f"Error reading data from channel {channel}: {e}")
                     continue
                     
         except Exception as e:
-            print(f"Error getting channel data: {e}")
+            self._report_error(f"Error getting channel data: {e}")
             # Return empty data if there's a problem
+            with self._channel_data_lock:
+                self._channel_data_cache = None
             return [], {}, []
         
+        # The arrays come from a buffer owned by this read, so they can be kept
+        with self._channel_data_lock:
+            self._channel_data_cache = (key, (active_channels, channel_data, is2d))
         return active_channels, channel_data, is2d
     
 
@@ -892,13 +1145,11 @@ class ChangeType(Enum):
 @dataclass
 class ChannelState:
     """Track state of each channel for efficient change detection"""
-    data_hash: str = ""
+    data_hash: object = None  # Digest from MCSDisplay._data_fingerprint
     shape: tuple = ()
     data_range: tuple = (0, 0)
     statistical_signature: tuple = (0, 0, 0, 0)  # min, max, mean, std
     last_update: float = 0
-    x_limits: tuple = (0, 1)
-    y_limits: tuple = (0, 1)
     update_count: int = 0
 
 class EfficientUpdateMixin:
@@ -911,6 +1162,10 @@ class EfficientUpdateMixin:
         self.update_thread = None
         self.update_stop_event = threading.Event()
         self.update_running = False
+        self._last_status_signature = None  # (started, totalsum, sweeps, channel settings) at last poll
+        self._pending_updates = {}  # Channel ID -> (ChangeType, is_2d, data, detection) awaiting the Tk thread
+        self._y_limits = {}  # Channel ID -> y-limits last set by the Tk thread
+        self._pending_lock = threading.Lock()
         
         # Configuration
         self.adaptive_update_interval = 0.1  # Base update interval
@@ -918,6 +1173,13 @@ class EfficientUpdateMixin:
         self.min_update_interval = 0.3  # Minimum interval during rapid changes
         self.change_threshold = 0.01  # Relative change threshold for rescaling
         self.stability_frames = 5  # Frames to wait before considering data stable
+        self.layout_grace_polls = 3  # Polls a channel layout change must persist before a rebuild
+        self._layout_mismatch_polls = 0
+        
+        # (shape, digest) -> summary stats, so contents seen before (e.g. after a
+        # rebuild or when toggling between channels) are not rescanned
+        self._stats_cache = OrderedDict()
+        self.stats_cache_size = 256
         
         # Performance tracking
         self.update_performance = {
@@ -964,9 +1226,12 @@ class EfficientUpdateMixin:
         """Main update loop running in separate thread"""
         current_interval = self.adaptive_update_interval
         no_change_count = 0
+        # Schedule against a monotonic deadline so wait() granularity and the time
+        # spent in each poll do not add up and stretch the interval
+        next_deadline = time.monotonic() + current_interval
         
-        while not self.update_stop_event.wait(current_interval):
-            start_time = time.time()
+        while not self.update_stop_event.wait(max(0.0, next_deadline - time.monotonic())):
+            start_time = time.monotonic()
             
             try:
                 # Check for changes and update accordingly
@@ -982,20 +1247,68 @@ class EfficientUpdateMixin:
                         current_interval = min(self.max_update_interval, current_interval * 1.1)
                 
                 # Update performance stats
-                update_time = time.time() - start_time
+                update_time = time.monotonic() - start_time
                 self._update_performance_stats(update_time, changes_detected)
                 
             except Exception as e:
-                print(f"Error in update loop: {e}")
+                self._report_error(f"Error in update loop: {e}")
                 # On error, fall back to slower updates
                 current_interval = self.adaptive_update_interval
+            
+            next_deadline += current_interval
+            # After an overrun, resume from now instead of firing a burst of catch-up polls
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now
+
+    def _acquisition_unchanged(self) -> bool:
+        """Return True if the device is halted and neither its counters nor the channel
+        settings (range, 2D layout) moved since the last poll
+        
+        The settings come from _read_channel_settings, which re-reads them after any
+        command and at least every settings_refresh_interval.
+        """
+        status = self.mcs.get_status()
+        signature = (status.started, status.cnt[MCS8.ST_TOTALSUM], status.cnt[MCS8.ST_SWEEPS],
+                     tuple(self._read_channel_settings()))
+        unchanged = not status.started and signature == self._last_status_signature
+        self._last_status_signature = signature
+        return unchanged
 
     def _check_and_update_channels(self) -> bool:
         """Check all channels for changes and update as needed"""
         try:
+            # Cheap status poll first: skip reading all spectra while idle, unless a
+            # layout change is being counted down (it must keep counting while halted)
+            if self._acquisition_unchanged() and not self._layout_mismatch_polls:
+                return False
+            
             # Get current data
             active_channels, channel_data, is2d = self._get_channel_data()
             
+            # Check for new/removed channels against the layout the display was built
+            # with. A new channel is shown at once. A channel that disappears may only
+            # be empty for a poll or two (e.g. right after an erase) and must not tear
+            # the figure down, so removals need to persist for layout_grace_polls
+            # consecutive polls.
+            current_channels = tuple(active_channels)
+            if current_channels != self.active_channels_cache:
+                self._layout_mismatch_polls += 1
+                channel_added = not set(current_channels).issubset(self.active_channels_cache)
+                if channel_added or self._layout_mismatch_polls >= self.layout_grace_polls:
+                    self._layout_mismatch_polls = 0
+                    print("Channel configuration changed - triggering rebuild")
+                    # Schedule a rebuild on the main thread
+                    if hasattr(self, 'tab_display'):
+                        self.tab_display.after_idle(self.force_rebuild)
+                    return True
+            else:
+                self._layout_mismatch_polls = 0
+            
+            # Forget state of channels that are no longer active
+            for channel in set(self.channel_states).difference(active_channels):
+                del self.channel_states[channel]
+            
             changes_detected = False
             channels_to_update = []
             
@@ -1016,22 +1329,45 @@ class EfficientUpdateMixin:
             if channels_to_update:
                 self._update_changed_channels(channels_to_update, channel_data)
             
-            # Check for new/removed channels
-            current_set = set(active_channels)
-            cached_set = set(self.channel_states.keys())
-            if current_set != cached_set:
-                print("Channel configuration changed - triggering rebuild")
-                # Schedule a rebuild on the main thread
-                if hasattr(self, 'tab_display'):
-                    self.tab_display.after_idle(self.force_rebuild)
-                return True
-            
             return changes_detected
             
         except Exception as e:
-            print(f"Error checking channel changes: {e}")
+            self._report_error(f"Error checking channel changes: {e}")
             return False
 
+    @staticmethod
+    def _summary_stats(data: np.ndarray) -> tuple:
+        """Return (min, max, mean, std) of data
+        
+        Mean and std come from a float64 sum and an einsum sum of squares, which
+        never materialize a full-size temporary, instead of np.mean + np.std
+        (three passes and a float64 copy of the deviations).
+        """
+        flat = data.ravel()
+        total = flat.sum(dtype=np.float64)
+        squares = np.einsum('i,i->', flat, flat, dtype=np.float64)
+        mean = total / flat.size
+        return flat.min(), flat.max(), mean, np.sqrt(max(squares / flat.size - mean * mean, 0.0))
+
+    def _cached_summary_stats(self, data: np.ndarray, digest) -> tuple:
+        """_summary_stats(data), memoized on the data's shape and content digest"""
+        key = (data.shape, digest)
+        stats = self._stats_cache.get(key)
+        if stats is not None:
+            self._stats_cache.move_to_end(key)
+            return stats
+        
+        stats = self._summary_stats(data)
+        self._stats_cache[key] = stats
+        if len(self._stats_cache) > self.stats_cache_size:
+            self._stats_cache.popitem(last=False)
+        return stats
+
+    @staticmethod
+    def _stats_close(a: tuple, b: tuple, rtol: float, atol: float = 1e-8) -> bool:
+        """np.allclose(a, b, rtol, atol) for short tuples of scalars, without building arrays"""
+        return len(a) == len(b) and all(abs(x - y) <= atol + rtol * abs(y) for x, y in zip(a, b))
+
     def _detect_1d_changes(self, channel: int, data: np.ndarray) -> ChangeType:
         """Detect changes in 1D channel data"""
         if data.ndim > 1 and data.shape[0] == 1:
@@ -1045,21 +1381,15 @@ class EfficientUpdateMixin:
         current_time = time.time()
         
         # Quick hash check for data changes
-        data_bytes = data.tobytes()
-        current_hash = hashlib.md5(data_bytes).hexdigest()
+        current_hash = self._data_fingerprint(data)[2]
         
         if current_hash == state.data_hash:
             return ChangeType.NO_CHANGE
         
         # Data has changed - analyze the type of change
         current_shape = data.shape
-        current_range = (np.min(data), np.max(data))
-        current_stats = (
-            current_range[0], 
-            current_range[1], 
-            np.mean(data), 
-            np.std(data)
-        )
+        current_stats = self._cached_summary_stats(data, current_hash)
+        current_range = current_stats[:2]
         
         change_type = ChangeType.DATA_CHANGE
         
@@ -1091,18 +1421,19 @@ class EfficientUpdateMixin:
         
         state = self.channel_states[channel]
         
-        # For 2D data, use shape and statistical signature for change detection
+        # Identical contents: one copy-free digest pass instead of four statistics passes
         current_shape = data.shape
-        current_stats = (
-            np.min(data), 
-            np.max(data), 
-            np.mean(data), 
-            np.std(data)
-        )
+        current_hash = self._data_fingerprint(data)[2]
+        if current_shape == state.shape and current_hash == state.data_hash:
+            return ChangeType.NO_CHANGE
+        state.data_hash = current_hash
+        
+        # For 2D data, use shape and statistical signature for change detection
+        current_stats = self._cached_summary_stats(data, current_hash)
         
         # Check for changes
         if (current_shape == state.shape and 
-            np.allclose(current_stats, state.statistical_signature, rtol=self.change_threshold)):
+            self._stats_close(current_stats, state.statistical_signature, self.change_threshold)):
             return ChangeType.NO_CHANGE
         
         change_type = ChangeType.DATA_CHANGE
@@ -1143,69 +1474,114 @@ class EfficientUpdateMixin:
                 mean_change > self.axis_scaling['y_stability_threshold'])
 
     def _update_changed_channels(self, channels_to_update: list, channel_data: dict):
-        """Update only the channels that have changed"""
-        def update_on_main_thread():
-            try:
-                for channel, change_type, is_2d in channels_to_update:
-                    if is_2d:
-                        self._update_2d_channel_efficient(channel, change_type)
-                    else:
-                        self._update_1d_channel_efficient(channel, change_type, channel_data[channel])
-                        
-                # Update canvas once for all changes
-                if self.canvas:
-                    self.canvas.draw_idle()
-                    
-            except Exception as e:
-                print(f"Error updating changed channels: {e}")
+        """Queue the changed channels and schedule one apply on the main thread
+        
+        Updates that arrive before the Tk thread got round to the previous batch
+        are merged into it (newest data, strongest change type per channel), so
+        at most one apply is pending no matter how slow the Tk thread is.
+        
+        The detection results for the queued data (range, statistics, digest and
+        update count) are copied out of the channel's state here, so the Tk thread
+        scales the line with the values of the data it draws, even if later polls
+        have already moved the shared ChannelState on or removed it.
+        """
+        with self._pending_lock:
+            schedule = not self._pending_updates
+            for channel, change_type, is_2d in channels_to_update:
+                previous = self._pending_updates.get(channel)
+                if previous is not None and previous[0].value > change_type.value:
+                    change_type = previous[0]
+                state = self.channel_states[channel]
+                detection = (state.data_range, state.statistical_signature,
+                             state.data_hash, state.update_count)
+                self._pending_updates[channel] = (change_type, is_2d, channel_data.get(channel), detection)
         
         # Schedule update on main thread
-        if hasattr(self, 'tab_display'):
-            self.tab_display.after_idle(update_on_main_thread)
+        if schedule and hasattr(self, 'tab_display'):
+            self.tab_display.after_idle(self._apply_pending_updates)
 
-    def _update_1d_channel_efficient(self, channel: int, change_type: ChangeType, data: np.ndarray):
-        """Efficiently update a 1D channel based on change type"""
+    def _apply_pending_updates(self):
+        """Apply the latest queued channel updates (main thread)"""
+        with self._pending_lock:
+            pending, self._pending_updates = self._pending_updates, {}
+        
+        try:
+            lines_updated = []
+            rescaled = False
+            for channel, (change_type, is_2d, data, detection) in pending.items():
+                if is_2d:
+                    self._update_2d_channel_efficient(channel, change_type, data)
+                elif channel in self.lines:
+                    rescaled |= self._update_1d_channel_efficient(channel, change_type, data, detection)
+                    lines_updated.append(channel)
+                    
+            # Blit the changed lines; one full draw only if limits moved or blitting is unavailable
+            if lines_updated and self.canvas:
+                if rescaled or not self._blit_lines(lines_updated):
+                    self.canvas.draw_idle()
+                
+        except Exception as e:
+            self._report_error(f"Error updating changed channels: {e}")
+
+    def _update_1d_channel_efficient(self, channel: int, change_type: ChangeType, data: np.ndarray,
+                                     detection: tuple) -> bool:
+        """Efficiently update a 1D channel based on change type
+        
+        detection is the (data_range, statistical_signature, data_hash, update_count)
+        that change detection computed for data. Returns True if the axis limits
+        changed, so the figure needs a full draw.
+        """
         if channel not in self.lines or channel not in self.axes:
-            return
+            return False
         
         if data.ndim > 1 and data.shape[0] == 1:
             data = data[0]
         
         line = self.lines[channel]
         ax = self.axes[channel]
-        state = self.channel_states[channel]
+        data_range, stats, data_hash, update_count = detection
         
-        # Update line data
-        x_data = np.arange(len(data))
-        line.set_data(x_data, data)
+        # Update line data (data_range was computed from this data during change detection)
+        x_data, y_data, _, _ = self._line_xy(data, data_range, self._display_bins(ax))
+        line.set_data(x_data, y_data)
         
         # Handle axis scaling based on change type
+        rescaled = False
         if change_type in [ChangeType.DIMENSION_CHANGE, ChangeType.SCALE_CHANGE]:
             # Update x-axis if data length changed
-            if len(data) != len(self.channel_cache.get(channel, [])):
+            if self.channel_sig.get(channel, (None,))[0] != data.shape:
                 ax.set_xlim(0, len(data))
-                state.x_limits = (0, len(data))
+                rescaled = True
             
             # Smart y-axis scaling
-            new_y_limits = self._calculate_optimal_y_limits(data, state)
-            if new_y_limits != state.y_limits:
+            current_limits = self._y_limits.get(channel)
+            new_y_limits = self._calculate_optimal_y_limits(data_range, stats[3], update_count,
+                                                            current_limits)
+            if new_y_limits != current_limits:
                 ax.set_ylim(new_y_limits)
-                state.y_limits = new_y_limits
+                self._y_limits[channel] = new_y_limits
+                rescaled = True
         
-        # Update cache
-        self.channel_cache[channel] = data.copy()
+        # Remember what was plotted (the digest was computed during change detection)
+        self.channel_sig[channel] = (data.shape, data.dtype.str, data_hash)
+        return rescaled
 
-    def _update_2d_channel_efficient(self, channel: int, change_type: ChangeType):
+    def _update_2d_channel_efficient(self, channel: int, change_type: ChangeType, data: np.ndarray = None):
         """Efficiently update a 2D/3D channel"""
         if channel in self.images:
             # For 2D/3D, delegate to existing update method
             # but only for significant changes
             if change_type != ChangeType.DATA_CHANGE:
-                self._update_2d_3d_image(channel)
+                self._update_2d_3d_image(channel, data)
 
-    def _calculate_optimal_y_limits(self, data: np.ndarray, state: ChannelState) -> tuple:
-        """Calculate optimal y-axis limits with adaptive margins and stability"""
-        data_min, data_max = np.min(data), np.max(data)
+    def _calculate_optimal_y_limits(self, data_range: tuple, data_std: float, update_count: int,
+                                    current_limits: tuple = None) -> tuple:
+        """Calculate optimal y-axis limits with adaptive margins and stability
+        
+        Uses the (min, max) and std that _detect_1d_changes computed for the data;
+        current_limits are the limits the axes show now (None if not set yet).
+        """
+        data_min, data_max = data_range
         
         if data_min == data_max:
             # Handle constant data
@@ -1214,26 +1590,25 @@ class EfficientUpdateMixin:
             return (center - margin, center + margin)
         
         # Calculate range and margin
-        data_range = data_max - data_min
+        data_span = data_max - data_min
         
         if self.axis_scaling['adaptive_margins']:
             # Adaptive margin based on data variability
-            data_std = np.std(data)
             if data_std > 0:
                 # Use larger margins for more variable data
-                margin_factor = self.axis_scaling['y_margin_factor'] * (1 + data_std / data_range)
+                margin_factor = self.axis_scaling['y_margin_factor'] * (1 + data_std / data_span)
             else:
                 margin_factor = self.axis_scaling['y_margin_factor']
         else:
             margin_factor = self.axis_scaling['y_margin_factor']
         
-        margin = data_range * margin_factor
+        margin = data_span * margin_factor
         
         # Consider previous limits for stability
-        if (state.y_limits and state.update_count > self.stability_frames and 
-            not self._needs_axis_expansion(data_min, data_max, state.y_limits)):
+        if (current_limits and update_count > self.stability_frames and 
+            not self._needs_axis_expansion(data_min, data_max, current_limits)):
             # Keep current limits if data still fits comfortably
-            return state.y_limits
+            return current_limits
         
         return (data_min - margin, data_max + margin)
 
@@ -1324,6 +1699,8 @@ def extend_mcs_display():
             # Clear efficient update state
             if hasattr(self, 'channel_states'):
                 self.channel_states.clear()
+            self._y_limits.clear()
+            self._last_status_signature = None
             
             # Call original rebuild
             MCSDisplay.force_rebuild(self)
@@ -4,12 +4,43 @@ Settings management module for MCS8 control interface.
 Handles channel settings, bitfield editing, and configuration management.
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox
 from structures import ACQSETTING, DATSETTING, BOARDSETTING
 from mcs8_func import CreateToolTip
 
 
+@functools.lru_cache(maxsize=64)
+def _sweepmode_hex(value: int) -> str:
+    """Format a sweepmode value as 8 hex digits (cached, the value rarely changes)"""
+    return f"{value:08x}"
+
+
+def _sweepmode_command_value(value: str) -> str:
+    """Sweepmode is entered as hex; add the 0x prefix the server expects if missing"""
+    return value if value.startswith('0x') else f"0x{value}"
+
+
+def _dac_voltage(value) -> str:
+    """Convert a raw DAC value to the voltage sent with the dacNv command"""
+    return f'{(-(float(value) - 2048) / 1000):.3f}'
+
+
+class ChannelWidget:
+    """Widgets and metadata of one channel setting (voltage widgets only use var and entry)"""
+    
+    __slots__ = ('var', 'entry', 'status', 'structure', 'meta', 'label')
+    
+    def __init__(self, var, entry, status=None, structure=None, meta=None, label=None):
+        self.var = var
+        self.entry = entry
+        self.status = status
+        self.structure = structure
+        self.meta = meta
+        self.label = label
+
+
 class BitfieldEditor:
     """Dialog for editing bitfield values with descriptive bit labels"""
     
@@ -31,27 +62,39 @@ class BitfieldEditor:
         }
     }
    
-    def __init__(self, parent, field_name, var, label, bit_descriptions=None, bit_width=16):
+    def __init__(self, parent, field_name, var, label, bit_descriptions=None, bit_width=16,
+                 on_apply=None):
         self.parent = parent
         self.field_name = field_name
         self.var = var
         self.label = label
+        self.on_apply = on_apply
         self.bit_width = bit_width
+        self._mask = (1 << bit_width) - 1
+        
+        # Bound str.format of the hex/binary patterns for this width, built once
+        self._hex_format = f"0x{{:0{(bit_width + 3) // 4}x}}".format
+        self._binary_format = f"{{:0{bit_width}b}}".format
         
         # Use provided descriptions or look up predefined ones
         if bit_descriptions:
             self.bit_descriptions = bit_descriptions
         else:
             self.bit_descriptions = self.BIT_DESCRIPTIONS.get(field_name, {})
+        
+        # (text, colour) of each bit's description label, resolved once; bits
+        # without a description are shown as unused/reserved
+        self._bit_labels = tuple(
+            (f"- {description}", 'blue') if description else ("- (unused)", 'gray')
+            for description in (self.bit_descriptions.get(bit, "") for bit in range(bit_width)))
        
         self.dialog = tk.Toplevel(parent)
+        # Keep the dialog unmapped while it is built so it is laid out and painted once
+        self.dialog.withdraw()
         self.dialog.title(f"Edit {label} Bits")
-        self.dialog.geometry("500x400")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         
-        # Center the dialog
-        self.dialog.update_idletasks()
+        # Center the dialog (the screen size is known without a layout flush)
         x = (self.dialog.winfo_screenwidth() // 2) - (500 // 2)
         y = (self.dialog.winfo_screenheight() // 2) - (400 // 2)
         self.dialog.geometry(f"500x400+{x}+{y}")
@@ -59,6 +102,12 @@ class BitfieldEditor:
         self._create_ui()
         self._load_current_value()
         
+        # Lay out the finished widget tree once, then show the dialog and make it modal
+        self.dialog.update_idletasks()
+        self.dialog.deiconify()
+        self.dialog.wait_visibility()
+        self.dialog.grab_set()
+        
     def _create_ui(self):
         """Create the bitfield editor UI"""
         main_frame = ttk.Frame(self.dialog)
@@ -96,49 +145,25 @@ class BitfieldEditor:
         bits_frame = ttk.LabelFrame(main_frame, text="Individual Bits")
         bits_frame.pack(fill='both', expand=True, pady=(0, 10))
        
-        # Create scrollable frame for bits
-        canvas = tk.Canvas(bits_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(bits_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-       
-        scrollable_frame.bind("<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        # Only as many bit rows as fit in the frame are created; scrolling
+        # reassigns them to other bits, so wide bitfields open as fast as narrow ones
+        self.bits_scrollbar = ttk.Scrollbar(bits_frame, orient="vertical", command=self._scroll_bits)
+        self.rows_frame = ttk.Frame(bits_frame)
+        self.rows_frame.pack_propagate(False)
+        self.rows_frame.bind("<Configure>", self._layout_bit_rows)
        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.rows_frame.pack(side="left", fill="both", expand=True, padx=(5, 0))
+        self.bits_scrollbar.pack(side="right", fill="y")
        
-        canvas.pack(side="left", fill="both", expand=True, padx=(5, 0))
-        scrollbar.pack(side="right", fill="y")
-       
-        # Create bit checkboxes with descriptions
-        self.bit_vars = {}
-        self.bit_checkboxes = {}
-        
-        for i in range(self.bit_width):
-            bit_frame = ttk.Frame(scrollable_frame)
-            bit_frame.pack(fill='x', padx=5, pady=1)
-            
-            var = tk.BooleanVar()
-            var.trace('w', self._update_value)
-            
-            # Create checkbox with bit number
-            cb = ttk.Checkbutton(bit_frame, text=f"Bit {i:2d}", variable=var, width=8)
-            cb.pack(side='left')
-            
-            # Add description if available
-            description = self.bit_descriptions.get(i, "")
-            if description:
-                desc_label = ttk.Label(bit_frame, text=f"- {description}", 
-                                     foreground='blue')
-                desc_label.pack(side='left', padx=(10, 0))
-            else:
-                # Show as unused/reserved if no description
-                desc_label = ttk.Label(bit_frame, text="- (unused)", 
-                                     foreground='gray')
-                desc_label.pack(side='left', padx=(10, 0))
-            
-            self.bit_vars[i] = var
-            self.bit_checkboxes[i] = cb
+        # The bits are kept in one integer; the rows only show the bits currently in view
+        self.value = 0
+        self._bit_rows = []  # (frame, var, checkbox, description label) per pooled row
+        self._first_bit = 0
+        self._visible_bits = 1
+        
+        self._create_bit_row()
+        self._bit_rows[0][0].pack(fill='x', padx=5, pady=1)
+        self._show_bits(0)
             
         # Quick action buttons
         action_frame = ttk.LabelFrame(main_frame, text="Quick Actions")
@@ -169,31 +194,104 @@ class BitfieldEditor:
         ttk.Button(button_frame, text="Cancel", command=self._cancel_clicked).pack(side='right', padx=(5, 0))
         ttk.Button(button_frame, text="Apply", command=self._apply_clicked).pack(side='right', padx=(5, 0))
         
-        # Bind mouse wheel to canvas
+        # Bind mouse wheel to the bit rows; wheel steps that arrive within one
+        # event loop pass are summed and applied as a single scroll
+        self._pending_scroll = 0
+        self._scroll_scheduled = False
+        
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind("<MouseWheel>", _on_mousewheel)
+            self._pending_scroll += int(-1*(event.delta/120))
+            if not self._scroll_scheduled:
+                self._scroll_scheduled = True
+                self.dialog.after_idle(self._flush_scroll)
+        self.dialog.bind("<MouseWheel>", _on_mousewheel)
+        
+    def _create_bit_row(self):
+        """Add one (unpacked) row to the pool of bit rows"""
+        row = len(self._bit_rows)
+        bit_frame = ttk.Frame(self.rows_frame)
+        
+        var = tk.BooleanVar()
+        cb = ttk.Checkbutton(bit_frame, variable=var, width=8,
+                             command=lambda: self._bit_row_clicked(row))
+        cb.pack(side='left')
+        
+        desc_label = ttk.Label(bit_frame)
+        desc_label.pack(side='left', padx=(10, 0))
+        
+        self._bit_rows.append((bit_frame, var, cb, desc_label))
+        
+    def _layout_bit_rows(self, event):
+        """Show as many pooled rows as fit in the bits frame, creating rows if needed"""
+        row_height = self._bit_rows[0][0].winfo_reqheight() + 2  # pady=1 above and below
+        visible = max(1, min(self.bit_width, event.height // row_height))
+        
+        while len(self._bit_rows) < visible:
+            self._create_bit_row()
+        for bit_frame, _, _, _ in self._bit_rows[self._visible_bits:visible]:
+            bit_frame.pack(fill='x', padx=5, pady=1)
+        for bit_frame, _, _, _ in self._bit_rows[visible:self._visible_bits]:
+            bit_frame.pack_forget()
+        
+        self._visible_bits = visible
+        self._show_bits(self._first_bit)
+        
+    def _show_bits(self, first):
+        """Assign the visible rows to bits first, first + 1, ... and update the scrollbar"""
+        first = max(0, min(first, self.bit_width - self._visible_bits))
+        self._first_bit = first
+        
+        for row, (_, var, cb, desc_label) in enumerate(self._bit_rows[:self._visible_bits]):
+            bit = first + row
+            var.set(bool(self.value >> bit & 1))
+            cb.config(text=f"Bit {bit:2d}")
+            text, colour = self._bit_labels[bit]
+            desc_label.config(text=text, foreground=colour)
+        
+        self.bits_scrollbar.set(first / self.bit_width, (first + self._visible_bits) / self.bit_width)
+        
+    def _scroll_bits(self, action, amount, unit=None):
+        """Scrollbar command: move the window of shown bits"""
+        if action == 'moveto':
+            first = round(float(amount) * self.bit_width)
+        elif unit == 'pages':
+            first = self._first_bit + int(amount) * self._visible_bits
+        else:
+            first = self._first_bit + int(amount)
+        self._show_bits(first)
+        
+    def _flush_scroll(self):
+        """Apply the wheel steps collected since the last scroll"""
+        steps, self._pending_scroll = self._pending_scroll, 0
+        self._scroll_scheduled = False
+        if steps:
+            self._scroll_bits('scroll', steps, 'units')
+        
+    def _bit_row_clicked(self, row):
+        """Flip the bit shown in row after its checkbox was clicked"""
+        self.value ^= 1 << (self._first_bit + row)
+        self._update_value()
+        
+    def _set_bits(self, value):
+        """Set all bits from value, then refresh the rows and the value labels once"""
+        self.value = value & self._mask
+        self._show_bits(self._first_bit)
+        self._update_value()
         
     def _load_current_value(self):
         """Load current value into bit checkboxes"""
         try:
-            current_value = int(self.var.get())
-            for bit, var in self.bit_vars.items():
-                var.set(bool(current_value & (1 << bit)))
-            self._update_value()
+            self._set_bits(int(self.var.get()))
         except ValueError:
             self._update_value_labels("Invalid", "Invalid", "Invalid")
             
-    def _update_value(self, *args):
-        """Update value display based on bit checkboxes"""
-        value = 0
-        for bit, var in self.bit_vars.items():
-            if var.get():
-                value |= (1 << bit)
+    def _update_value(self):
+        """Update value display based on the current bits"""
+        value = self.value
         
         decimal_str = str(value)
-        hex_str = f"0x{value:0{(self.bit_width + 3) // 4}x}"
-        binary_str = f"{value:0{self.bit_width}b}"
+        hex_str = self._hex_format(value)
+        binary_str = self._binary_format(value)
         
         self._update_value_labels(decimal_str, hex_str, binary_str)
         
@@ -205,18 +303,15 @@ class BitfieldEditor:
         
     def _set_all_bits(self):
         """Set all bits to 1"""
-        for var in self.bit_vars.values():
-            var.set(True)
+        self._set_bits(self._mask)
             
     def _clear_all_bits(self):
         """Clear all bits to 0"""
-        for var in self.bit_vars.values():
-            var.set(False)
+        self._set_bits(0)
             
     def _toggle_all_bits(self):
         """Toggle all bits"""
-        for var in self.bit_vars.values():
-            var.set(not var.get())
+        self._set_bits(self.value ^ self._mask)
             
     def _set_from_entry(self, event=None):
         """Set bits based on value entered in entry field"""
@@ -230,11 +325,9 @@ class BitfieldEditor:
                 value = int(value_str)
                 
             # Clamp value to bit width
-            max_value = (1 << self.bit_width) - 1
-            value = min(value, max_value)
+            value = min(value, self._mask)
             
-            for bit, var in self.bit_vars.items():
-                var.set(bool(value & (1 << bit)))
+            self._set_bits(value)
                 
             self.value_entry.delete(0, tk.END)
             
@@ -245,17 +338,15 @@ class BitfieldEditor:
             self.dialog.after(200, lambda: self.value_entry.config(background=original_bg))
             
     def _get_current_value(self):
-        """Get current value from bit checkboxes"""
-        value = 0
-        for bit, var in self.bit_vars.items():
-            if var.get():
-                value |= (1 << bit)
-        return value
+        """Get current value of the bits"""
+        return self.value
             
     def _apply_clicked(self):
         """Apply changes without closing dialog"""
         value = self._get_current_value()
         self.var.set(str(value))
+        if self.on_apply:
+            self.on_apply()
         
     def _ok_clicked(self):
         """Apply changes and close dialog"""
@@ -279,6 +370,7 @@ class SettingsManager:
         self.max_channels = 8
         self.modified_settings = set()
         self.channel_widgets = {}
+        self._voltage_sync_map = {}  # DAC field name -> StringVar of its voltage widget
         
         # Command mappings
         self.command_mapping = {
@@ -299,6 +391,15 @@ class SettingsManager:
             f'dac{i}': f'dac{i}v' for i in range(8)
         }
         
+        # field name -> ("command=", value formatter or None), resolved once
+        self._command_formatters = {
+            field_name: (f"{command_name}=", None)
+            for field_name, command_name in self.command_mapping.items()
+        }
+        self._command_formatters['sweepmode'] = ("sweepmode=", _sweepmode_command_value)
+        for dac_name in self.voltage_dac_mapping:
+            self._command_formatters[dac_name] = (f"{self.command_mapping[dac_name]}=", _dac_voltage)
+        
         # Settings data structures
         self.settings_data = {}
         
@@ -315,20 +416,27 @@ class SettingsManager:
                                padding="5", anchor="nw", justify="left")
         status_label.pack(expand=True, fill="both", padx=5, pady=5)
         
-        # Settings frame with scrolling
-        settings_frame = self._create_scrollable_frame(main_frame)
+        # Settings frame, scrolling only if there are many settings
+        settings_frame = self._create_scrollable_frame(
+            main_frame, rows=len(settings_class.settings_meta_flat) + 1)
         
         # Create settings dictionary and widgets
         settings_dict = self._create_settings_widgets(settings_frame, settings_class, title)
         
         return settings_dict, status_label
         
-    def _create_scrollable_frame(self, parent):
-        """Create a scrollable frame for settings"""
+    def _create_scrollable_frame(self, parent, rows=None, scroll_threshold=12):
+        """Create a scrollable frame for settings
+        
+        If the caller knows it adds fewer than scroll_threshold rows, a plain
+        frame is returned instead, without the Canvas and scrollbar.
+        """
         settings_frame = ttk.Frame(parent)
         settings_frame.pack(expand=True, fill="both", padx=5, pady=5)
+        if rows is not None and rows < scroll_threshold:
+            return settings_frame
 
-        canvas = tk.Canvas(settings_frame)
+        canvas = tk.Canvas(settings_frame, highlightthickness=0, bd=0)
         scrollbar = ttk.Scrollbar(settings_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
@@ -353,11 +461,11 @@ class SettingsManager:
         header.pack(fill='x', padx=5, pady=5)
 
         # Create widgets for each setting
-        for field_name, meta in settings_class.settings_meta.items():
+        for field_name, label, default, tooltip in settings_class.settings_meta_flat:
             settings_dict[field_name] = {
-                'label': meta['label'],
-                'value': tk.StringVar(value=str(meta['default'])),
-                'tooltip': meta['tooltip']
+                'label': label,
+                'value': tk.StringVar(value=str(default)),
+                'tooltip': tooltip
             }
             
             self._create_setting_widget(parent, field_name, settings_dict[field_name], title)
@@ -392,6 +500,10 @@ class SettingsManager:
         # Store parent reference
         self.channel_parent = parent
         
+        # One Tcl command shared by all channel setting entries to notice edits
+        self._entry_fields = {}  # Entry widget path -> field name
+        self._entry_vcmd = (parent.register(self._on_entry_edited), '%W')
+        
         # Main container
         main_container = ttk.Frame(parent)
         main_container.pack(fill='both', expand=True, padx=5, pady=5)
@@ -452,10 +564,33 @@ class SettingsManager:
             ("Data", self._create_data_settings)
         ]
         
-        for name, creator_func in tab_configs:
+        # Only the first tab is built now; the others are built the first time
+        # they are selected, see _build_pending_tab
+        self._pending_tabs = {}
+        for index, (name, creator_func) in enumerate(tab_configs):
             tab = ttk.Frame(self.channel_notebook)
             self.channel_notebook.add(tab, text=name)
-            creator_func(tab)
+            if index == 0:
+                creator_func(tab)
+            else:
+                self._pending_tabs[str(tab)] = (tab, creator_func)
+        
+        self.channel_notebook.bind("<<NotebookTabChanged>>", self._build_pending_tab)
+    
+    def _build_pending_tab(self, event=None):
+        """Build the selected settings tab on its first selection and load its values"""
+        pending = self._pending_tabs.pop(self.channel_notebook.select(), None)
+        if pending is None:
+            return
+        
+        tab, creator_func = pending
+        existing = set(self.channel_widgets)
+        creator_func(tab)
+        
+        new_fields = [field_name for field_name in self.channel_widgets
+                      if field_name not in existing and not field_name.endswith('_voltage')]
+        if new_fields:
+            self.load_channel_settings(new_fields)
     
     def _create_acquisition_settings(self, parent):
         """Create acquisition settings widgets"""
@@ -606,16 +741,17 @@ class SettingsManager:
         
         # Value variable
         var = tk.StringVar()
-        var.trace('w', lambda *args, fn=field_name: self._mark_modified(fn))
         
-        # Create entry widget
-        entry = ttk.Entry(frame, textvariable=var, width=15)
+        # Create entry widget; typing marks the setting modified, loading values does not
+        entry = ttk.Entry(frame, textvariable=var, width=15,
+                          validate='key', validatecommand=self._entry_vcmd)
         entry.pack(side='left', padx=5)
+        self._entry_fields[str(entry)] = field_name
         
         # Add special widgets for bitfields
         if widget_type == 'bitfield':
             ttk.Button(frame, text="Edit Bits", 
-                      command=lambda: self._open_bitfield_editor(field_name, var, label)).pack(side='left', padx=2)
+                      command=lambda fn=field_name: self._open_bitfield_editor(fn)).pack(side='left', padx=2)
         
         # Status indicator
         status_label = ttk.Label(frame, text="●", foreground="green", width=2)
@@ -623,13 +759,11 @@ class SettingsManager:
         
         # Apply button
         ttk.Button(frame, text="Apply", 
-                  command=lambda: self.apply_channel_setting(field_name, var.get(), status_label)).pack(side='right', padx=5)
+                  command=lambda fn=field_name: self._apply_by_name(fn)).pack(side='right', padx=5)
         
-        # Store widget references
-        self.channel_widgets[field_name] = {
-            'var': var, 'entry': entry, 'status': status_label,
-            'structure': structure_class, 'meta': meta
-        }
+        # Store widget references; the buttons look their widgets up here by field name
+        self.channel_widgets[field_name] = ChannelWidget(
+            var, entry, status=status_label, structure=structure_class, meta=meta, label=label)
         
         CreateToolTip(entry, tooltip)
     
@@ -654,7 +788,8 @@ class SettingsManager:
         ttk.Button(frame, text="Set Voltage",
                   command=lambda: self.apply_voltage(dac_name, var.get())).pack(side='right', padx=5)
         
-        self.channel_widgets[f'{dac_name}_voltage'] = {'var': var, 'entry': entry}
+        self.channel_widgets[f'{dac_name}_voltage'] = ChannelWidget(var, entry)
+        self._voltage_sync_map[dac_name] = var
         CreateToolTip(entry, f"Set {label} in Volts")
     
     def _create_channel_action_buttons(self, parent):
@@ -707,22 +842,21 @@ class SettingsManager:
     def apply_channel_setting(self, field_name, value, status_label):
         """Apply a single channel setting"""
         try:
-            command_name = self.command_mapping.get(field_name)
-            if not command_name:
+            formatter = self._command_formatters.get(field_name)
+            if not formatter:
                 raise ValueError(f"No command mapping for {field_name}")
             
             # Format value
-            if field_name == 'sweepmode' and not value.startswith('0x'):
-                value = f"0x{value}"
+            prefix, format_value = formatter
+            if format_value is not None:
+                value = format_value(value)
             
-            if 'dac' in field_name:
-                value = f'{(-(float(value) - 2048) / 1000):.3f}'
-                voltage_widget = self.channel_widgets.get(f'{field_name}_voltage')
-                if voltage_widget:
-                    voltage_widget['var'].set(value)
+            voltage_var = self._voltage_sync_map.get(field_name)
+            if voltage_var is not None:
+                voltage_var.set(value)
             
             # Send command
-            command = f"{command_name}={value}"
+            command = prefix + value
             res = self.mcs.run_cmd(command)
             
             # Update status
@@ -737,6 +871,11 @@ class SettingsManager:
             self._update_status(f"Error: {e}", "red")
             messagebox.showerror("Error", f"Failed to apply {field_name}: {e}")
     
+    def _apply_by_name(self, field_name):
+        """Apply the value currently entered for a channel setting"""
+        widget_info = self.channel_widgets[field_name]
+        self.apply_channel_setting(field_name, widget_info.var.get(), widget_info.status)
+    
     def apply_voltage(self, dac_name, voltage_str):
         """Apply voltage setting to DAC"""
         try:
@@ -764,10 +903,8 @@ class SettingsManager:
         try:
             applied_count = 0
             for field_name in list(self.modified_settings):
-                widget_info = self.channel_widgets.get(field_name)
-                if widget_info:
-                    value = widget_info['var'].get()
-                    self.apply_channel_setting(field_name, value, widget_info['status'])
+                if field_name in self.channel_widgets:
+                    self._apply_by_name(field_name)
                     applied_count += 1
             
             messagebox.showinfo("Success", f"Applied {applied_count} changes")
@@ -781,8 +918,13 @@ class SettingsManager:
             if messagebox.askyesno("Confirm Reset", "Discard all unsaved changes?"):
                 self.load_channel_settings()
     
-    def load_channel_settings(self):
-        """Load current channel settings from device"""
+    def load_channel_settings(self, field_names=None):
+        """Load current channel settings from device
+        
+        Args:
+            field_names (list, optional): Only load these fields (e.g. the ones of
+                a tab that was just built). All built fields by default.
+        """
         try:
             self._update_status("Loading settings...", "orange")
             
@@ -793,12 +935,17 @@ class SettingsManager:
 
 
 
+            if field_names is None:
+                widgets = self.channel_widgets.items()
+            else:
+                widgets = [(field_name, self.channel_widgets[field_name]) for field_name in field_names]
+
             # Update widgets
-            for field_name, widget_info in self.channel_widgets.items():
+            for field_name, widget_info in widgets:
                 if field_name.endswith('_voltage'):
                     continue
                     
-                structure = widget_info['structure']
+                structure = widget_info.structure
                 value = None
             
                 if structure == ACQSETTING:
@@ -814,20 +961,22 @@ class SettingsManager:
                             res = self.mcs.run_cmd(f'rdac{dacnum} 0')
                             value = int(res, 16)
 
-                        value_dac = f'{(-(float(value) - 2048) / 1000):.3f}'
-                        voltage_widget = self.channel_widgets.get(f'{field_name}_voltage')
-                        if voltage_widget:
-                            voltage_widget['var'].set(value_dac)
+                        voltage_var = self._voltage_sync_map.get(field_name)
+                        if voltage_var is not None:
+                            voltage_var.set(_dac_voltage(value))
                     
                 if value is not None:
                     if field_name == 'sweepmode':
-                        widget_info['var'].set(f"{value:08x}")
+                        widget_info.var.set(_sweepmode_hex(value))
                     else:
-                        widget_info['var'].set(str(value))
+                        widget_info.var.set(str(value))
                     
-                    widget_info['status'].config(foreground="green")
+                    widget_info.status.config(foreground="green")
             
-            self.modified_settings.clear()
+            if field_names is None:
+                self.modified_settings.clear()
+            else:
+                self.modified_settings.difference_update(field_names)
             self._update_status("Settings loaded", "green")
             
         except Exception as e:
@@ -839,23 +988,35 @@ class SettingsManager:
         try:
             structure = structure_getter()
             
-            for key in settings_dict:
+            for key, setting_data in settings_dict.items():
                 value = getattr(structure, key, None)
                 if value is not None:
                     if key == 'sweepmode':
-                        value = f"{value:08x}"
-                    settings_dict[key]['value'].set(str(value))
+                        value = _sweepmode_hex(value)
+                    else:
+                        value = str(value)
+                    # Only write changed values; set() fires traces and redraws the entry
+                    var = setting_data['value']
+                    if var.get() != value:
+                        var.set(value)
                     
         except Exception as e:
             self.output_callback(f"Settings Update Error: {str(e)}\n")
     
     # Helper methods
+    def _on_entry_edited(self, widget_path):
+        """validatecommand of the channel setting entries: mark the edited setting, accept the edit"""
+        field_name = self._entry_fields.get(widget_path)
+        if field_name is not None and field_name not in self.modified_settings:
+            self._mark_modified(field_name)
+        return True
+    
     def _mark_modified(self, field_name):
         """Mark a setting as modified"""
         self.modified_settings.add(field_name)
         widget_info = self.channel_widgets.get(field_name)
-        if widget_info and 'status' in widget_info:
-            widget_info['status'].config(foreground="orange")
+        if widget_info and widget_info.status is not None:
+            widget_info.status.config(foreground="orange")
     
     def _update_status(self, message, color="black"):
         """Update status label"""
@@ -875,12 +1036,14 @@ class SettingsManager:
         widget_info = self.channel_widgets.get(f'{dac_name}_voltage')
         if widget_info:
             try:
-                current = float(widget_info['var'].get())
+                current = float(widget_info.var.get())
                 new_voltage = current + delta
-                widget_info['var'].set(f"{new_voltage:.3f}")
+                widget_info.var.set(f"{new_voltage:.3f}")
             except ValueError:
-                widget_info['var'].set("0.000")
+                widget_info.var.set("0.000")
     
-    def _open_bitfield_editor(self, field_name, var, label):
+    def _open_bitfield_editor(self, field_name):
         """Open a bitfield editor dialog"""
-        BitfieldEditor(self.channel_parent, field_name, var, label)
\ No newline at end of file
+        widget_info = self.channel_widgets[field_name]
+        BitfieldEditor(self.channel_parent, field_name, widget_info.var, widget_info.label,
+                       on_apply=lambda: self._mark_modified(field_name))
\ No newline at end of file
@@ -12,6 +12,11 @@ class Constants:
     ST_STARTS = 6
     ST_ZEROEVTS = 7
 
+def flatten_settings_meta(settings_meta):
+    """Return settings_meta as a tuple of (field_name, label, default, tooltip) in definition order"""
+    return tuple((name, meta['label'], meta['default'], meta['tooltip'])
+                 for name, meta in settings_meta.items())
+
 # --- Structure definitions ---
 class ACQSETTING(Structure):
     """Acquisition settings structure - MCS Channel Status"""
@@ -111,6 +116,7 @@ class ACQSETTING(Structure):
             'min': 0.0
         }
     }
+    settings_meta_flat = flatten_settings_meta(settings_meta)
 
 @dataclass
 class DATSETTING(Structure):
@@ -186,6 +192,7 @@ class DATSETTING(Structure):
             'max_length': 255
         }
     }
+    settings_meta_flat = flatten_settings_meta(settings_meta)
 
 @dataclass
 class BOARDSETTING(Structure):
@@ -341,6 +348,7 @@ class BOARDSETTING(Structure):
             'min': 0.0
         }
     }
+    settings_meta_flat = flatten_settings_meta(settings_meta)
 
 class LVCOINCDEF(Structure):
     """Level coincidence definition structure"""